@@ -3,7 +3,7 @@ Agents package for AI Operations Assistant
 """
 
 from .planner import PlannerAgent
-from .executor import ExecutorAgent
+from .executor import ExecutorAgent, StepResult
 from .verifier import VerifierAgent
 
-__all__ = ['PlannerAgent', 'ExecutorAgent', 'VerifierAgent']
+__all__ = ['PlannerAgent', 'ExecutorAgent', 'VerifierAgent', 'StepResult']
@@ -2,14 +2,72 @@
 Executor Agent - Executes plans and calls tools
 """
 
+import asyncio
 import logging
-from typing import Dict, Any, List
-from tools import get_registry
-import time
+import random
+from dataclasses import dataclass
+from typing import Dict, Any, Callable, List, Optional, Tuple
+from tools import get_registry, io_queue
+from utils import TTLCache, dumps
+from .planner import PlannerAgent
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(slots=True, frozen=True)
+class StepResult:
+    """Outcome of a single plan step"""
+    
+    step: Any
+    status: str  # "success", "error" or "skipped"
+    description: Optional[str] = None
+    tool: Optional[str] = None
+    result: Any = None
+    error: Optional[str] = None
+    reason: Optional[str] = None
+    attempts: Optional[int] = None
+    cached: bool = False
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert to the JSON-friendly dict returned by the API and CLI
+        
+        Returns:
+            Dict with unset fields omitted
+        """
+        data = {"step": self.step}
+        if self.description is not None:
+            data["description"] = self.description
+        if self.tool is not None:
+            data["tool"] = self.tool
+        data["status"] = self.status
+        for key in ("result", "error", "reason", "attempts"):
+            value = getattr(self, key)
+            if value is not None:
+                data[key] = value
+        if self.cached:
+            data["cached"] = True
+        return data
+
+# Error substrings that signal the upstream API is throttling us
+RATE_LIMIT_MARKERS = ("rate limit", "429")
+
+# Error substrings for failures that retrying cannot fix
+NON_RETRYABLE_MARKERS = ("401", "403", "404", "unauthorized", "forbidden", "not found")
+
+# Shared result payload for steps that call no tool
+_INFO_MSG = {"message": "Informational step completed"}
+
+# Cache lifetimes (seconds) for tools whose data goes stale quickly
+TOOL_CACHE_TTLS = {
+    "weather": 120,
+    "news": 60
+}
+
+# Most results cached per tool; least recently used are evicted first
+TOOL_CACHE_MAX_ENTRIES = 256
+
+
 class ExecutorAgent:
     """Agent responsible for executing plans and calling tools"""
     
@@ -17,11 +75,19 @@ class ExecutorAgent:
         """Initialize Executor Agent"""
         self.tool_registry = get_registry()
         self.max_retries = 3
-        self.retry_delay = 1  # seconds
+        self.base_delay = 0.25  # seconds
+        self.max_delay = 8.0  # seconds
+        self._tool_caches: Dict[str, TTLCache] = {}
+        self._cache_ttl = 300  # seconds
+        # Prefetches still running, by cache key, so a matching step can join them
+        self._prefetches: Dict[str, asyncio.Task] = {}
     
     def execute(self, plan: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Execute a plan step by step
+        Execute a plan, running independent steps concurrently
+        
+        Blocks until done, even inside a running event loop; async callers
+        should await aexecute instead.
         
         Args:
             plan: Execution plan from Planner Agent
@@ -29,40 +95,110 @@ class ExecutorAgent:
         Returns:
             Execution results
         """
+        return io_queue.run(self.aexecute(plan))
+    
+    async def aexecute(
+        self,
+        plan: Dict[str, Any],
+        on_step: Optional[Callable[[StepResult], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        Execute a plan as a DAG of steps
+        
+        Every step whose dependencies have completed successfully is
+        dispatched immediately, so steps with disjoint `depends_on` lists
+        run concurrently instead of one after another.
+        
+        Args:
+            plan: Execution plan from Planner Agent
+            on_step: Optional callback invoked with each StepResult as it completes
+            
+        Returns:
+            Execution results, with "results" as StepResult objects in plan order
+        """
         logger.info("Starting plan execution")
         
         steps = plan.get("steps", [])
-        results = []
+        results = {}  # Keyed by position in the plan
         execution_context = {}  # Store results for dependent steps
         
-        for step in steps:
-            step_num = step.get("step_number", 0)
-            logger.info(f"Executing step {step_num}: {step.get('description')}")
-            
-            # Check dependencies
-            dependencies = step.get("depends_on", [])
-            if not self._check_dependencies(dependencies, results):
-                logger.warning(f"Step {step_num} dependencies not met, skipping")
-                results.append({
-                    "step": step_num,
-                    "status": "skipped",
-                    "reason": "Dependencies not met"
-                })
-                continue
-            
-            # Execute step
-            step_result = self._execute_step(step, execution_context)
-            results.append(step_result)
-            
-            # Store result for future steps
-            if step_result["status"] == "success":
-                execution_context[f"step_{step_num}"] = step_result["result"]
+        # Dependencies are checked with integer bitmasks: each step number
+        # owns one bit, and completed_mask has the bits of successful steps
+        step_bits, dependency_masks = self._build_dependency_masks(steps)
+        completed_mask = 0
+        
+        remaining = dict(enumerate(steps))
+        pending: Dict[asyncio.Task, int] = {}
+        
+        try:
+            while remaining or pending:
+                # Dispatch every step whose dependencies are satisfied
+                completed_inline = False
+                for index, step in list(remaining.items()):
+                    if self._check_dependencies(dependency_masks[index], completed_mask):
+                        del remaining[index]
+                        logger.info("Executing step %s: %s", step.get("step_number", 0), step.get("description"))
+                        
+                        if self._is_informational(step):
+                            # No I/O involved, so complete it without scheduling a task
+                            step_result = self._informational_result(step)
+                            results[index] = step_result
+                            execution_context[f"step_{step_result.step}"] = step_result.result
+                            if on_step:
+                                on_step(step_result)
+                            completed_mask |= step_bits[step_result.step]
+                            completed_inline = True
+                            continue
+                        
+                        task = asyncio.create_task(self._execute_step(step, execution_context))
+                        pending[task] = index
+                
+                if completed_inline:
+                    # Steps completed inline may have unblocked others
+                    continue
+                
+                if not pending:
+                    # Nothing running and nothing ready: the rest can never run
+                    for index, step in remaining.items():
+                        step_num = step.get("step_number", 0)
+                        logger.warning("Step %s dependencies not met, skipping", step_num)
+                        results[index] = StepResult(
+                            step=step_num,
+                            status="skipped",
+                            reason="Dependencies not met"
+                        )
+                        if on_step:
+                            on_step(results[index])
+                    break
+                
+                done, _ = await asyncio.wait(pending.keys(), return_when=asyncio.FIRST_COMPLETED)
+                
+                for task in done:
+                    index = pending.pop(task)
+                    step_result = task.result()
+                    results[index] = step_result
+                    if on_step:
+                        on_step(step_result)
+                    
+                    # Store result for future steps
+                    if step_result.status == "success":
+                        step_num = step_result.step
+                        execution_context[f"step_{step_num}"] = step_result.result
+                        completed_mask |= step_bits[step_num]
+            
+        finally:
+            # Steps still running when execution is cancelled are cancelled with it
+            for task in pending:
+                task.cancel()
+        
+        # Report results in plan order regardless of completion order
+        results = [results[index] for index in sorted(results)]
         
         # Summarize execution
-        successful = sum(1 for r in results if r["status"] == "success")
-        failed = sum(1 for r in results if r["status"] == "error")
+        successful = sum(1 for r in results if r.status == "success")
+        failed = sum(1 for r in results if r.status == "error")
         
-        logger.info(f"Execution complete: {successful} successful, {failed} failed")
+        logger.info("Execution complete: %d successful, %d failed", successful, failed)
         
         return {
             "total_steps": len(steps),
@@ -72,7 +208,7 @@ class ExecutorAgent:
             "execution_context": execution_context
         }
     
-    def _execute_step(self, step: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
+    async def _execute_step(self, step: Dict[str, Any], context: Dict[str, Any]) -> StepResult:
         """
         Execute a single step
         
@@ -83,97 +219,333 @@ class ExecutorAgent:
         Returns:
             Step execution result
         """
+        # Handle steps with no tool (informational/planning steps)
+        if self._is_informational(step):
+            return self._informational_result(step)
+        
         step_num = step.get("step_number", 0)
         tool_name = step.get("tool")
-        parameters = step.get("parameters", {})
-        
-        # Handle steps with no tool (informational/planning steps)
-        if tool_name == "none" or not tool_name:
-            return {
-                "step": step_num,
-                "description": step.get("description"),
-                "status": "success",
-                "result": {"message": "Informational step completed"}
-            }
         
         # Resolve parameter references to previous step results
-        resolved_params = self._resolve_parameters(parameters, context)
+        resolved_params = self._resolve_parameters(step, context)
+        
+        # Serve repeated tool calls from the cache
+        use_cache = not step.get("no_cache", False)
+        cache_key = self._cache_key(tool_name, resolved_params) if use_cache else None
+        if use_cache:
+            cached = self._tool_cache(tool_name).get(cache_key)
+            if cached is None:
+                cached = await self._join_prefetch(cache_key)
+            if cached is not None:
+                logger.info("Using cached result for %s", tool_name)
+                return StepResult(
+                    step=step_num,
+                    description=step.get("description"),
+                    tool=tool_name,
+                    status="success",
+                    result=cached,
+                    attempts=0,
+                    cached=True
+                )
         
         # Execute with retries
         for attempt in range(self.max_retries):
             try:
-                logger.info(f"Attempting to execute {tool_name} (attempt {attempt + 1}/{self.max_retries})")
+                logger.info("Attempting to execute %s (attempt %d/%d)", tool_name, attempt + 1, self.max_retries)
+                
+                result = await self.tool_registry.aexecute_tool(tool_name, **resolved_params)
                 
-                result = self.tool_registry.execute_tool(tool_name, **resolved_params)
+                if use_cache:
+                    self._store_cached(tool_name, cache_key, result)
                 
-                return {
-                    "step": step_num,
-                    "description": step.get("description"),
-                    "tool": tool_name,
-                    "status": "success",
-                    "result": result,
-                    "attempts": attempt + 1
-                }
+                return StepResult(
+                    step=step_num,
+                    description=step.get("description"),
+                    tool=tool_name,
+                    status="success",
+                    result=result,
+                    attempts=attempt + 1
+                )
                 
             except Exception as e:
-                logger.error(f"Step {step_num} attempt {attempt + 1} failed: {str(e)}")
+                logger.error("Step %s attempt %d failed: %s", step_num, attempt + 1, e)
                 
-                if attempt < self.max_retries - 1:
-                    time.sleep(self.retry_delay)
+                if attempt < self.max_retries - 1 and self._is_retryable(e):
+                    await asyncio.sleep(self._backoff_delay(attempt, e))
                     continue
                 else:
-                    return {
-                        "step": step_num,
-                        "description": step.get("description"),
-                        "tool": tool_name,
-                        "status": "error",
-                        "error": str(e),
-                        "attempts": attempt + 1
-                    }
+                    return StepResult(
+                        step=step_num,
+                        description=step.get("description"),
+                        tool=tool_name,
+                        status="error",
+                        error=str(e),
+                        attempts=attempt + 1
+                    )
+    
+    async def aexecute_tool_call(
+        self,
+        step_number: int,
+        tool_name: str,
+        parameters: Dict[str, Any]
+    ) -> StepResult:
+        """
+        Execute a single tool call requested outside a plan
+        
+        Used when the LLM drives tool use through function calling; the
+        call gets the same retries and caching as a plan step.
+        
+        Args:
+            step_number: Number to report the call under
+            tool_name: Name of the tool
+            parameters: Tool parameters
+            
+        Returns:
+            Step execution result
+        """
+        step = {
+            "step_number": step_number,
+            "description": f"Call {tool_name}",
+            "tool": tool_name,
+            "parameters": parameters
+        }
+        return await self._execute_step(step, {})
+    
+    async def prefetch(self, tool_name: str, parameters: Dict[str, Any]) -> None:
+        """
+        Run a tool call ahead of time so a later step is served from the cache
+        
+        Failures are logged and ignored; the step then calls the tool itself.
+        
+        Args:
+            tool_name: Name of the tool
+            parameters: Tool parameters
+        """
+        cache_key = self._cache_key(tool_name, parameters)
+        if self._tool_cache(tool_name).get(cache_key) is not None or cache_key in self._prefetches:
+            return
+        
+        call = asyncio.ensure_future(self.tool_registry.aexecute_tool(tool_name, **parameters))
+        self._prefetches[cache_key] = call
+        try:
+            result = await call
+        except Exception as e:
+            logger.debug("Prefetch of %s failed: %s", tool_name, e)
+            return
+        finally:
+            if self._prefetches.get(cache_key) is call:
+                del self._prefetches[cache_key]
+        
+        self._store_cached(tool_name, cache_key, result)
+    
+    async def _join_prefetch(self, cache_key: str) -> Any:
+        """
+        Wait for a prefetch of the same call that is still running
+        
+        Args:
+            cache_key: Key from _cache_key
+            
+        Returns:
+            The prefetched result, or None if there is no usable prefetch
+        """
+        call = self._prefetches.get(cache_key)
+        if call is None or call.get_loop() is not asyncio.get_running_loop():
+            return None
+        
+        try:
+            # Shielded so a cancelled step does not cancel the shared call
+            result = await asyncio.shield(call)
+        except asyncio.CancelledError:
+            if not call.cancelled():
+                raise
+            return None
+        except Exception:
+            return None
+        
+        if isinstance(result, dict) and result.get("success") is False:
+            return None
+        return result
     
-    def _check_dependencies(self, dependencies: List[int], results: List[Dict[str, Any]]) -> bool:
+    def _is_informational(self, step: Dict[str, Any]) -> bool:
+        """
+        Check whether a step calls no tool
+        
+        Args:
+            step: Plan step
+            
+        Returns:
+            True for informational/planning steps
+        """
+        tool_name = step.get("tool")
+        return not tool_name or tool_name == "none"
+    
+    def _informational_result(self, step: Dict[str, Any]) -> StepResult:
+        """
+        Build the result of an informational step
+        
+        Args:
+            step: Plan step
+            
+        Returns:
+            Step execution result
+        """
+        return StepResult(
+            step=step.get("step_number", 0),
+            description=step.get("description"),
+            status="success",
+            result=dict(_INFO_MSG)
+        )
+    
+    def _cache_key(self, tool_name: str, parameters: Dict[str, Any]) -> str:
+        """
+        Build a cache key from a tool name and its resolved parameters
+        
+        Args:
+            tool_name: Name of the tool
+            parameters: Resolved tool parameters
+            
+        Returns:
+            Cache key string
+        """
+        return tool_name + "|" + dumps(parameters, sort_keys=True, default=str)
+    
+    def _tool_cache(self, tool_name: str) -> TTLCache:
+        """
+        Get the result cache for a tool, created on first use
+        
+        Each tool gets its own TTL from TOOL_CACHE_TTLS and its own size cap.
+        
+        Args:
+            tool_name: Name of the tool
+            
+        Returns:
+            TTL cache for the tool's results
+        """
+        cache = self._tool_caches.get(tool_name)
+        if cache is None:
+            cache = self._tool_caches.setdefault(tool_name, TTLCache(
+                ttl=TOOL_CACHE_TTLS.get(tool_name, self._cache_ttl),
+                maxsize=TOOL_CACHE_MAX_ENTRIES
+            ))
+        return cache
+    
+    def _store_cached(self, tool_name: str, cache_key: str, result: Any) -> None:
+        """
+        Cache a tool result
+        
+        Results the tool itself reports as failed are not cached.
+        
+        Args:
+            tool_name: Name of the tool
+            cache_key: Key from _cache_key
+            result: Tool execution result
+        """
+        if isinstance(result, dict) and result.get("success") is False:
+            return
+        
+        self._tool_cache(tool_name).set(cache_key, result)
+    
+    def _backoff_delay(self, attempt: int, error: Exception) -> float:
+        """
+        Compute the delay before the next retry
+        
+        Uses exponential backoff with jitter so that steps failing against
+        the same API do not retry in lockstep.
+        
+        Args:
+            attempt: Zero-based index of the attempt that just failed
+            error: Exception raised by the failed attempt
+            
+        Returns:
+            Delay in seconds
+        """
+        message = str(error).lower()
+        if any(marker in message for marker in RATE_LIMIT_MARKERS):
+            return self.max_delay
+        
+        delay = min(self.max_delay, self.base_delay * (2 ** attempt))
+        return random.uniform(delay / 2, delay)
+    
+    def _is_retryable(self, error: Exception) -> bool:
+        """
+        Check whether a failed tool call is worth retrying
+        
+        Args:
+            error: Exception raised by the tool
+            
+        Returns:
+            False for errors such as bad credentials or missing resources
+        """
+        if isinstance(error, TypeError):
+            # Bad parameters for the tool; the next attempt would fail the same way
+            return False
+        
+        message = str(error).lower()
+        return not any(marker in message for marker in NON_RETRYABLE_MARKERS)
+    
+    def _build_dependency_masks(self, steps: List[Dict[str, Any]]) -> Tuple[Dict[Any, int], List[int]]:
+        """
+        Encode step numbers and dependencies as bitmasks
+        
+        Args:
+            steps: Plan steps
+            
+        Returns:
+            Tuple of (bit for each step number, dependency mask per step)
+        """
+        step_bits = {}
+        for step in steps:
+            step_num = step.get("step_number", 0)
+            if step_num not in step_bits:
+                step_bits[step_num] = 1 << len(step_bits)
+        
+        # Dependencies on steps missing from the plan map to a bit that is never set
+        unreachable = 1 << len(step_bits)
+        
+        dependency_masks = []
+        for step in steps:
+            mask = 0
+            for dep in step.get("depends_on") or ():
+                mask |= step_bits.get(dep, unreachable)
+            dependency_masks.append(mask)
+        
+        return step_bits, dependency_masks
+    
+    def _check_dependencies(self, dependency_mask: int, completed_mask: int) -> bool:
         """
         Check if step dependencies are satisfied
         
         Args:
-            dependencies: List of step numbers this step depends on
-            results: Completed step results
+            dependency_mask: Bits of the steps this step depends on
+            completed_mask: Bits of the steps that completed successfully
             
         Returns:
             True if all dependencies are met
         """
-        if not dependencies:
-            return True
-        
-        completed_steps = {r.get("step") for r in results if r.get("status") == "success"}
-        return all(dep in completed_steps for dep in dependencies)
+        return completed_mask & dependency_mask == dependency_mask
     
-    def _resolve_parameters(self, parameters: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
+    def _resolve_parameters(self, step: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
         """
         Resolve parameter references to context values
         
         Args:
-            parameters: Parameter dictionary
+            step: Plan step, compiled by the planner when possible
             context: Execution context
             
         Returns:
             Resolved parameters
         """
-        resolved = {}
+        resolvers = step.get("_resolvers")
+        if resolvers is None:
+            # Plan did not come from PlannerAgent; compile it now
+            PlannerAgent._compile_step_resolvers(step)
+            resolvers = step["_resolvers"]
         
-        for key, value in parameters.items():
-            if isinstance(value, str) and value.startswith("$step_"):
-                # Reference to previous step result
-                step_ref = value[1:]  # Remove $
-                if step_ref in context:
-                    resolved[key] = context[step_ref]
-                else:
-                    logger.warning(f"Could not resolve parameter reference: {value}")
-                    resolved[key] = value
-            else:
-                resolved[key] = value
-        
-        return resolved
+        # Unresolvable references are passed through as the literal "$step_N"
+        return {
+            key: context.get(payload, "$" + payload) if is_reference else payload
+            for key, is_reference, payload in resolvers
+        }
     
     def execute_single_tool(self, tool_name: str, **parameters) -> Dict[str, Any]:
         """
@@ -194,7 +566,7 @@ class ExecutorAgent:
                 "result": result
             }
         except Exception as e:
-            logger.error(f"Direct tool execution failed: {str(e)}")
+            logger.error("Direct tool execution failed: %s", e)
             return {
                 "status": "error",
                 "tool": tool_name,
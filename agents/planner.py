@@ -2,14 +2,38 @@
 Planner Agent - Analyzes tasks and creates execution plans
 """
 
-import json
+import asyncio
+import copy
+import hashlib
 import logging
-from typing import Dict, Any, List
+import os
+import tempfile
+import threading
+import time
+import weakref
+from typing import Dict, Any, List, Optional, Set, Tuple
 from llm import LLMClient
 from tools import get_registry
+from utils import dumps, loads
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on plans kept in the persistent cache; oldest are dropped first
+PLAN_CACHE_MAX_ENTRIES = 256
+
+# Seconds a persisted plan stays reusable
+PLAN_CACHE_TTL = float(os.getenv("PLAN_CACHE_TTL", "86400"))
+
+# Sections requested from the LLM in a single planning call
+PLAN_SECTIONS = {
+    "plan": {
+        "description": "The execution plan, using the structure described in the instructions"
+    },
+    "verify_scaffold": {
+        "direct_answer": "Final answer for the user if the task needs no tools, otherwise null"
+    }
+}
+
 
 class PlannerAgent:
     """Agent responsible for analyzing tasks and creating execution plans"""
@@ -23,21 +47,50 @@ class PlannerAgent:
         """
         self.llm = llm_client
         self.tool_registry = get_registry()
+        # Entries are {"plan": ..., "created_at": epoch seconds}
+        self._plan_cache: Dict[str, Dict[str, Any]] = {}
+        # plan() runs in several threads via plan_async; guards the cache and its file
+        self._plan_cache_lock = threading.Lock()
+        
+        # Plans persist across processes in a JSON file, loaded on first use
+        self.plan_cache_path = os.path.expanduser(
+            os.getenv("PLAN_CACHE_PATH", "~/.aiops_plan_cache.json")
+        )
+        self._plan_cache_loaded = False
+        
+        # Bounds concurrent planning calls per event loop to respect provider rate limits
+        self.max_concurrency = int(os.getenv("PLANNER_CONCURRENCY", "8"))
+        self._semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+            weakref.WeakKeyDictionary()
+        )
+        
+        # Serialized tool specs, rebuilt only when the registry changes
+        self._tool_specs_version: Optional[int] = None
+        self._tool_specs_json = ""
+        self._tool_specs_digest = ""
     
-    def plan(self, task: str) -> Dict[str, Any]:
+    def plan(self, task: str, use_cache: bool = True) -> Dict[str, Any]:
         """
         Create an execution plan for a given task
         
         Args:
             task: Natural language task description
+            use_cache: Reuse a previous plan for the same task and tools
             
         Returns:
             Execution plan with steps and tools
         """
-        logger.info(f"Planning task: {task}")
+        logger.info("Planning task: %s", task)
         
         # Get available tools
-        available_tools = self.tool_registry.get_all_specs()
+        tool_specs_json, tool_specs_digest = self._get_tool_specs()
+        
+        cache_key = self._cache_key(task, tool_specs_digest)
+        if use_cache:
+            cached = self._get_cached_plan(cache_key)
+            if cached is not None:
+                logger.info("Using cached plan")
+                return cached
         
         # Create planning prompt
         system_prompt = """You are a planning agent that breaks down tasks into executable steps.
@@ -50,7 +103,7 @@ Guidelines:
 - Consider dependencies between steps
 - Plan for error handling
 
-Output a JSON object with this structure:
+The plan is a JSON object with this structure:
 {
   "task_analysis": "Brief analysis of what needs to be done",
   "steps": [
@@ -68,30 +121,216 @@ Output a JSON object with this structure:
         prompt = f"""Task: {task}
 
 Available tools:
-{json.dumps(available_tools, indent=2)}
+{tool_specs_json}
 
 Create a detailed execution plan for this task."""
         
         try:
-            plan_data = self.llm.generate_structured(
+            # Ask for the verifier's scaffold in the same round-trip
+            sections = self.llm.generate_structured_multi(
                 prompt=prompt,
+                sections=PLAN_SECTIONS,
                 system_prompt=system_prompt,
                 temperature=0.3
             )
+            plan_data = sections["plan"]
             
             # Validate plan structure
-            if not self._validate_plan(plan_data):
+            is_valid = self._validate_plan(plan_data)
+            if not is_valid:
                 logger.warning("Generated plan failed validation, attempting to fix")
                 plan_data = self._fix_plan(plan_data, task)
             
-            logger.info(f"Created plan with {len(plan_data.get('steps', []))} steps")
+            # A direct answer is only kept for plans that call no tool
+            uses_tools = any(step.get("tool") not in (None, "none") for step in plan_data.get("steps", []))
+            if sections["verify_scaffold"].get("direct_answer") and not uses_tools:
+                plan_data["verify_scaffold"] = sections["verify_scaffold"]
+            
+            self._compile_resolvers(plan_data)
+            
+            # Only plans that validated as generated are worth reusing; plans
+            # carrying a direct answer are not, so the answer never goes stale
+            if use_cache and is_valid and "verify_scaffold" not in plan_data:
+                self._store_cached_plan(cache_key, plan_data)
+            
+            logger.info("Created plan with %d steps", len(plan_data.get("steps", [])))
             return plan_data
             
         except Exception as e:
-            logger.error(f"Planning failed: {str(e)}")
+            logger.error("Planning failed: %s", e)
             # Return a minimal fallback plan
             return self._create_fallback_plan(task)
     
+    async def plan_async(self, task: str, use_cache: bool = True) -> Dict[str, Any]:
+        """
+        Create an execution plan without blocking the event loop
+        
+        Many tasks can be planned concurrently with asyncio.gather; at most
+        max_concurrency planning calls are in flight on one loop.
+        
+        Args:
+            task: Natural language task description
+            use_cache: Reuse a previous plan for the same task and tools
+            
+        Returns:
+            Execution plan with steps and tools
+        """
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+        
+        async with semaphore:
+            return await asyncio.to_thread(self.plan, task, use_cache)
+    
+    def _get_tool_specs(self) -> Tuple[str, str]:
+        """
+        Get the tool specs as prompt JSON plus a digest of them
+        
+        Both are recomputed only when the registry version changes.
+        
+        Returns:
+            Tuple of (indented specs JSON, SHA-1 digest of the specs)
+        """
+        if self._tool_specs_version != self.tool_registry.version:
+            available_tools = self.tool_registry.get_all_specs()
+            self._tool_specs_json = dumps(available_tools, indent=True)
+            self._tool_specs_digest = hashlib.sha1(
+                dumps(available_tools, sort_keys=True).encode()
+            ).hexdigest()
+            self._tool_specs_version = self.tool_registry.version
+        
+        return self._tool_specs_json, self._tool_specs_digest
+    
+    def _cache_key(self, task: str, tool_specs_digest: str) -> str:
+        """
+        Build the plan cache key for a task
+        
+        The key includes a digest of the tool specs, so cached plans are
+        invalidated whenever the available tools change.
+        
+        Args:
+            task: Task description
+            tool_specs_digest: Digest from _get_tool_specs
+            
+        Returns:
+            Cache key string
+        """
+        normalized = " ".join(task.lower().split())
+        return f"{normalized}|{tool_specs_digest}"
+    
+    def _get_cached_plan(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached plan that has not expired
+        
+        Args:
+            cache_key: Key from _cache_key
+            
+        Returns:
+            Copy of the cached plan, or None
+        """
+        with self._plan_cache_lock:
+            self._load_plan_cache()
+            entry = self._plan_cache.get(cache_key)
+            if entry is None:
+                return None
+            if not self._is_fresh(entry):
+                del self._plan_cache[cache_key]
+                return None
+            plan = copy.deepcopy(entry["plan"])
+        
+        self._compile_resolvers(plan)
+        return plan
+    
+    def _store_cached_plan(self, cache_key: str, plan: Dict[str, Any]) -> None:
+        """
+        Cache a plan in memory and on disk
+        
+        Args:
+            cache_key: Key from _cache_key
+            plan: Validated plan
+        """
+        entry = {"plan": copy.deepcopy(self.without_resolvers(plan)), "created_at": time.time()}
+        with self._plan_cache_lock:
+            self._plan_cache.pop(cache_key, None)
+            self._plan_cache[cache_key] = entry
+            self._save_plan_cache()
+    
+    @staticmethod
+    def _is_fresh(entry: Any) -> bool:
+        """
+        Check that a cache entry is well-formed and within PLAN_CACHE_TTL
+        
+        Args:
+            entry: Cache entry
+            
+        Returns:
+            True if the entry can be reused
+        """
+        return (
+            isinstance(entry, dict)
+            and isinstance(entry.get("plan"), dict)
+            and isinstance(entry.get("created_at"), (int, float))
+            and time.time() - entry["created_at"] < PLAN_CACHE_TTL
+        )
+    
+    def _load_plan_cache(self) -> None:
+        """
+        Merge plans persisted by earlier processes into the in-memory cache
+        
+        Runs once per planner with _plan_cache_lock held; a missing or
+        unreadable file leaves the cache empty, and expired entries are
+        dropped.
+        """
+        if self._plan_cache_loaded:
+            return
+        self._plan_cache_loaded = True
+        
+        try:
+            with open(self.plan_cache_path, "rb") as f:
+                stored = loads(f.read())
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            logger.warning("Ignoring unreadable plan cache %s: %s", self.plan_cache_path, e)
+            return
+        
+        if isinstance(stored, dict):
+            fresh = {key: entry for key, entry in stored.items() if self._is_fresh(entry)}
+            self._plan_cache = {**fresh, **self._plan_cache}
+            logger.info("Loaded %d cached plans", len(fresh))
+    
+    def _save_plan_cache(self) -> None:
+        """
+        Write the plan cache to disk, keeping the most recent entries
+        
+        Called with _plan_cache_lock held. Each write goes to its own
+        temporary file that atomically replaces the cache file, so
+        concurrent readers and writers never see a partial write.
+        """
+        while len(self._plan_cache) > PLAN_CACHE_MAX_ENTRIES:
+            del self._plan_cache[next(iter(self._plan_cache))]
+        
+        directory = os.path.dirname(self.plan_cache_path) or "."
+        tmp_path = None
+        try:
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(
+                dir=directory, prefix=os.path.basename(self.plan_cache_path) + ".", suffix=".tmp"
+            )
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(dumps(self._plan_cache))
+            os.replace(tmp_path, self.plan_cache_path)
+            tmp_path = None
+        except OSError as e:
+            logger.warning("Could not persist plan cache: %s", e)
+        finally:
+            if tmp_path is not None:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+    
     def _validate_plan(self, plan: Dict[str, Any]) -> bool:
         """
         Validate plan structure
@@ -118,7 +357,7 @@ Create a detailed execution plan for this task."""
             # Check if tool exists
             tool_name = step["tool"]
             if tool_name != "none" and not self.tool_registry.get(tool_name):
-                logger.warning(f"Plan references unknown tool: {tool_name}")
+                logger.warning("Plan references unknown tool: %s", tool_name)
                 return False
         
         return True
@@ -169,6 +408,9 @@ Create a detailed execution plan for this task."""
         """
         Create a simple fallback plan when planning fails
         
+        The plan is marked with "fallback" so the verifier never reports it
+        as a verified answer.
+        
         Args:
             task: Task description
             
@@ -176,6 +418,7 @@ Create a detailed execution plan for this task."""
             Fallback plan
         """
         return {
+            "fallback": True,
             "task_analysis": f"Simple execution of: {task}",
             "steps": [
                 {
@@ -189,6 +432,64 @@ Create a detailed execution plan for this task."""
             "required_tools": []
         }
     
+    def _compile_resolvers(self, plan: Dict[str, Any]) -> None:
+        """
+        Attach precompiled parameter resolvers to every step of a plan
+        
+        Args:
+            plan: Plan to compile in place
+        """
+        known_refs = {f"step_{step.get('step_number')}" for step in plan.get("steps", [])}
+        for step in plan.get("steps", []):
+            self._compile_step_resolvers(step, known_refs)
+    
+    @staticmethod
+    def _compile_step_resolvers(step: Dict[str, Any], known_refs: Optional[Set[str]] = None) -> None:
+        """
+        Precompute how each parameter of a step is resolved
+        
+        Stores `step["_resolvers"]` as a list of [key, is_reference, payload]
+        entries, where payload is a context key such as "step_1" for
+        references and the literal value otherwise. The executor then
+        resolves parameters without inspecting each value.
+        
+        Args:
+            step: Plan step to compile in place
+            known_refs: Context keys of the plan's steps, used to flag bad references
+        """
+        resolvers = []
+        for key, value in (step.get("parameters") or {}).items():
+            if isinstance(value, str) and value.startswith("$step_"):
+                step_ref = value[1:]  # Remove $
+                if known_refs is not None and step_ref not in known_refs:
+                    logger.warning("Step %s references unknown step: %s", step.get("step_number"), value)
+                resolvers.append([key, True, step_ref])
+            else:
+                resolvers.append([key, False, value])
+        
+        step["_resolvers"] = resolvers
+    
+    @staticmethod
+    def without_resolvers(plan: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Copy a plan without the compiled resolvers
+        
+        Resolvers are internal to execution; use this before a plan is put
+        in a prompt, a response or the plan cache.
+        
+        Args:
+            plan: Compiled plan
+            
+        Returns:
+            Plan with step-level "_resolvers" removed
+        """
+        stripped = dict(plan)
+        stripped["steps"] = [
+            {key: value for key, value in step.items() if key != "_resolvers"}
+            for step in plan.get("steps", [])
+        ]
+        return stripped
+    
     def refine_plan(self, plan: Dict[str, Any], feedback: str) -> Dict[str, Any]:
         """
         Refine an existing plan based on feedback
@@ -203,7 +504,7 @@ Create a detailed execution plan for this task."""
         logger.info("Refining plan based on feedback")
         
         prompt = f"""Original plan:
-{json.dumps(plan, indent=2)}
+{dumps(self.without_resolvers(plan), indent=True)}
 
 Feedback: {feedback}
 
@@ -219,11 +520,12 @@ Refine the plan to address this feedback. Maintain the same JSON structure."""
             )
             
             if self._validate_plan(refined_plan):
+                self._compile_resolvers(refined_plan)
                 return refined_plan
             else:
                 logger.warning("Refined plan failed validation, returning original")
                 return plan
                 
         except Exception as e:
-            logger.error(f"Plan refinement failed: {str(e)}")
+            logger.error("Plan refinement failed: %s", e)
             return plan
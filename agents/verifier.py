@@ -2,13 +2,29 @@
 Verifier Agent - Validates results and ensures output quality
 """
 
-import json
 import logging
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 from llm import LLMClient
+from .executor import StepResult
+from utils import dumps
 
 logger = logging.getLogger(__name__)
 
+# Error substrings for failures that may succeed on a later attempt
+RETRYABLE_MARKERS = ("timeout", "rate limit", "connection")
+
+# Answer given when no step produced usable data
+NO_RESULTS_ANSWER = (
+    "I was unable to complete the task due to execution errors. "
+    "Please check the error details and try again."
+)
+
+# Answer given when the planner could not produce a plan
+PLANNING_FAILED_ANSWER = (
+    "I was unable to plan this task. "
+    "Please check the configuration (for example the LLM API key) and try again."
+)
+
 
 class VerifierAgent:
     """Agent responsible for validating execution results and ensuring quality"""
@@ -41,11 +57,19 @@ class VerifierAgent:
         """
         logger.info("Verifying execution results")
         
+        if plan.get("fallback"):
+            return self._verify_fallback()
+        
+        # Plans made only of informational steps need no checking or synthesis
+        results = execution_results.get("results", [])
+        if results and all(r.status == "success" and r.tool in (None, "none") for r in results):
+            return self._verify_trivial(plan, results)
+        
         # Check for errors
-        failed_steps = [r for r in execution_results.get("results", []) if r.get("status") == "error"]
+        failed_steps = [r for r in execution_results.get("results", []) if r.status == "error"]
         
         if failed_steps:
-            logger.warning(f"Found {len(failed_steps)} failed steps")
+            logger.warning("Found %d failed steps", len(failed_steps))
         
         # Analyze completeness
         completeness = self._check_completeness(task, plan, execution_results)
@@ -53,14 +77,131 @@ class VerifierAgent:
         # Generate final answer
         final_answer = self._generate_final_answer(task, execution_results, completeness)
         
+        return self._build_verification(completeness, len(failed_steps), final_answer)
+    
+    def verify_stream(
+        self,
+        task: str,
+        plan: Dict[str, Any],
+        execution_results: Dict[str, Any]
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Verify execution results, streaming the final answer as it is generated
+        
+        Yields {"event": "final_token", "data": text} for each chunk of the
+        final answer, then a single {"event": "verification", "data": ...}
+        carrying the same dictionary verify() returns.
+        
+        Args:
+            task: Original task
+            plan: Execution plan
+            execution_results: Results from Executor Agent
+            
+        Yields:
+            Answer chunk events followed by the verification event
+        """
+        logger.info("Verifying execution results (streaming)")
+        
+        results = execution_results.get("results", [])
+        if plan.get("fallback"):
+            verification = self._verify_fallback()
+            yield {"event": "final_token", "data": verification["final_answer"]}
+            yield {"event": "verification", "data": verification}
+            return
+        
+        if results and all(r.status == "success" and r.tool in (None, "none") for r in results):
+            verification = self._verify_trivial(plan, results)
+            yield {"event": "final_token", "data": verification["final_answer"]}
+            yield {"event": "verification", "data": verification}
+            return
+        
+        failed_steps = [r for r in results if r.status == "error"]
+        completeness = self._check_completeness(task, plan, execution_results)
+        
+        chunks = []
+        for chunk in self._stream_final_answer(task, execution_results, completeness):
+            chunks.append(chunk)
+            yield {"event": "final_token", "data": chunk}
+        final_answer = "".join(chunks).strip()
+        
+        yield {
+            "event": "verification",
+            "data": self._build_verification(completeness, len(failed_steps), final_answer)
+        }
+    
+    def _build_verification(
+        self,
+        completeness: Dict[str, Any],
+        failed_steps: int,
+        final_answer: str
+    ) -> Dict[str, Any]:
+        """
+        Assemble the verification result
+        
+        Args:
+            completeness: Completeness analysis
+            failed_steps: Number of failed steps
+            final_answer: Final answer text
+            
+        Returns:
+            Verification results with final answer
+        """
         return {
             "verified": completeness["is_complete"],
             "completeness": completeness,
-            "failed_steps": len(failed_steps),
+            "failed_steps": failed_steps,
             "final_answer": final_answer,
             "needs_retry": not completeness["is_complete"] and completeness.get("can_retry", False)
         }
     
+    def _verify_fallback(self) -> Dict[str, Any]:
+        """
+        Verify the fallback plan used when planning failed
+        
+        Returns:
+            Unverified result explaining that no plan could be made
+        """
+        return {
+            "verified": False,
+            "completeness": {
+                "is_complete": False,
+                "reason": "Planning failed",
+                "can_retry": False
+            },
+            "failed_steps": 0,
+            "final_answer": PLANNING_FAILED_ANSWER,
+            "needs_retry": False
+        }
+    
+    def _verify_trivial(self, plan: Dict[str, Any], results: List[StepResult]) -> Dict[str, Any]:
+        """
+        Verify a plan whose steps all succeeded without calling a tool
+        
+        Args:
+            plan: Execution plan
+            results: Step results
+            
+        Returns:
+            Verification results, answered without an LLM call
+        """
+        # The planner's direct answer only stands in for plans that call no tool
+        final_answer = None
+        if not any(step.get("tool") not in (None, "none") for step in plan.get("steps", [])):
+            final_answer = (plan.get("verify_scaffold") or {}).get("direct_answer")
+        if not final_answer:
+            final_answer = "\n".join(r.description for r in results if r.description)
+        
+        return {
+            "verified": True,
+            "completeness": {
+                "is_complete": True,
+                "reason": "Trivial plan"
+            },
+            "failed_steps": 0,
+            "final_answer": final_answer,
+            "needs_retry": False
+        }
+    
     def _check_completeness(
         self,
         task: str,
@@ -79,21 +220,29 @@ class VerifierAgent:
             Completeness analysis
         """
         results = execution_results.get("results", [])
-        successful_steps = [r for r in results if r.get("status") == "success"]
         total_steps = execution_results.get("total_steps", 0)
         
-        # Basic completeness check
-        basic_complete = len(successful_steps) == total_steps and total_steps > 0
+        # Single pass over the results
+        successful = 0
+        failed_steps = []
+        retryable = False
+        for r in results:
+            status = r.status
+            if status == "success":
+                successful += 1
+            elif status == "error":
+                failed_steps.append(r.step)
+                if not retryable:
+                    error = (r.error or "").lower()
+                    retryable = any(marker in error for marker in RETRYABLE_MARKERS)
         
-        if basic_complete:
+        # Basic completeness check
+        if successful == total_steps and total_steps > 0:
             return {
                 "is_complete": True,
                 "reason": "All steps completed successfully"
             }
         
-        # Analyze failures
-        failed_steps = [r for r in results if r.get("status") == "error"]
-        
         if not failed_steps:
             return {
                 "is_complete": False,
@@ -101,18 +250,10 @@ class VerifierAgent:
                 "can_retry": False
             }
         
-        # Check if failures are retryable
-        retryable = any(
-            "timeout" in r.get("error", "").lower() or
-            "rate limit" in r.get("error", "").lower() or
-            "connection" in r.get("error", "").lower()
-            for r in failed_steps
-        )
-        
         return {
             "is_complete": False,
             "reason": f"{len(failed_steps)} steps failed",
-            "failed_steps": [r.get("step") for r in failed_steps],
+            "failed_steps": failed_steps,
             "can_retry": retryable
         }
     
@@ -135,24 +276,103 @@ class VerifierAgent:
         """
         logger.info("Generating final answer")
         
-        # Collect successful results
-        successful_results = [
-            r for r in execution_results.get("results", [])
-            if r.get("status") == "success" and r.get("result")
-        ]
+        successful_results = self._successful_results(execution_results)
+        if not successful_results:
+            return NO_RESULTS_ANSWER
+        
+        system_prompt, prompt = self._final_answer_prompt(task, successful_results, completeness)
         
+        try:
+            answer = self.llm.generate(
+                prompt=prompt,
+                system_prompt=system_prompt,
+                temperature=0.2
+            )
+            return answer.strip()
+            
+        except Exception as e:
+            logger.error("Failed to generate final answer: %s", e)
+            return self._create_fallback_answer(successful_results)
+    
+    def _stream_final_answer(
+        self,
+        task: str,
+        execution_results: Dict[str, Any],
+        completeness: Dict[str, Any]
+    ) -> Iterator[str]:
+        """
+        Generate the final answer as a stream of text chunks
+        
+        Args:
+            task: Original task
+            execution_results: Execution results
+            completeness: Completeness analysis
+            
+        Yields:
+            Chunks of the final answer
+        """
+        logger.info("Streaming final answer")
+        
+        successful_results = self._successful_results(execution_results)
         if not successful_results:
-            return "I was unable to complete the task due to execution errors. Please check the error details and try again."
+            yield NO_RESULTS_ANSWER
+            return
+        
+        system_prompt, prompt = self._final_answer_prompt(task, successful_results, completeness)
+        
+        streamed = False
+        try:
+            for chunk in self.llm.generate_stream(
+                prompt=prompt,
+                system_prompt=system_prompt,
+                temperature=0.2
+            ):
+                streamed = True
+                yield chunk
+                
+        except Exception as e:
+            logger.error("Failed to stream final answer: %s", e)
+            # Chunks already sent cannot be retracted; only fall back when none were
+            if not streamed:
+                yield self._create_fallback_answer(successful_results)
+    
+    def _successful_results(self, execution_results: Dict[str, Any]) -> List[StepResult]:
+        """
+        Collect the successful steps that produced a result
         
+        Args:
+            execution_results: Execution results
+            
+        Returns:
+            Successful step results
+        """
+        return [
+            r for r in execution_results.get("results", [])
+            if r.status == "success" and r.result
+        ]
+    
+    def _final_answer_prompt(
+        self,
+        task: str,
+        successful_results: List[StepResult],
+        completeness: Dict[str, Any]
+    ) -> Tuple[str, str]:
+        """
+        Build the prompts used to synthesize the final answer
+        
+        Args:
+            task: Original task
+            successful_results: Successful step results
+            completeness: Completeness analysis
+            
+        Returns:
+            Tuple of (system prompt, prompt)
+        """
         # Prepare context for LLM
-        results_summary = []
-        for r in successful_results:
-            step_desc = r.get("description", f"Step {r.get('step')}")
-            result_data = r.get("result", {})
-            results_summary.append({
-                "step": step_desc,
-                "data": result_data
-            })
+        results_summary = [
+            {"step": r.description or f"Step {r.step}", "data": r.result}
+            for r in successful_results
+        ]
         
         system_prompt = """You are synthesizing execution results into a natural, helpful answer.
 
@@ -166,25 +386,15 @@ Guidelines:
         prompt = f"""Task: {task}
 
 Execution Results:
-{json.dumps(results_summary, indent=2)}
+{dumps(results_summary, default=str)}
 
 Completeness: {completeness.get('reason', 'Complete')}
 
 Generate a natural language answer that addresses the user's task."""
         
-        try:
-            answer = self.llm.generate(
-                prompt=prompt,
-                system_prompt=system_prompt,
-                temperature=0.2
-            )
-            return answer.strip()
-            
-        except Exception as e:
-            logger.error(f"Failed to generate final answer: {str(e)}")
-            return self._create_fallback_answer(successful_results)
+        return system_prompt, prompt
     
-    def _create_fallback_answer(self, results: List[Dict[str, Any]]) -> str:
+    def _create_fallback_answer(self, results: List[StepResult]) -> str:
         """
         Create a simple fallback answer from results
         
@@ -200,8 +410,8 @@ Generate a natural language answer that addresses the user's task."""
         answer_parts = ["Here are the results:\n"]
         
         for r in results:
-            step_desc = r.get("description", f"Step {r.get('step')}")
-            result_data = r.get("result", {})
+            step_desc = r.description or f"Step {r.step}"
+            result_data = r.result
             
             answer_parts.append(f"\n{step_desc}:")
             
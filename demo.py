@@ -7,12 +7,21 @@ Demonstrates various capabilities and use cases
 import os
 import sys
 import time
+import asyncio
+from functools import lru_cache
 from dotenv import load_dotenv
 
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from main import AIOperationsAssistant
+from tools import io_queue
+
+
+@lru_cache(maxsize=1)
+def get_assistant():
+    """Get the assistant shared by all demos (built on first use)"""
+    return AIOperationsAssistant()
 
 
 def print_header(title):
@@ -35,99 +44,85 @@ def print_result(result):
     print("-"*80 + "\n")
 
 
+async def _execute_all(assistant, tasks):
+    """Execute tasks concurrently, returning results in task order"""
+    return await asyncio.gather(*[assistant.aexecute_task(task) for task in tasks])
+
+
+def run_tasks(tasks):
+    """Run a demo's tasks concurrently and print each result"""
+    assistant = get_assistant()
+    results = io_queue.run(_execute_all(assistant, tasks))
+    
+    for task, result in zip(tasks, results):
+        print(f"Task: {task}\n")
+        print_result(result)
+        time.sleep(1)
+
+
 def demo_github_search():
     """Demo GitHub repository search"""
     print_header("DEMO 1: GitHub Repository Search")
     
-    assistant = AIOperationsAssistant()
-    
     tasks = [
         "Find the top 3 machine learning repositories on GitHub",
         "Search for Python web frameworks on GitHub",
         "Show me popular AI repositories"
     ]
     
-    for task in tasks:
-        print(f"Task: {task}\n")
-        result = assistant.execute_task(task)
-        print_result(result)
-        time.sleep(2)
+    run_tasks(tasks)
 
 
 def demo_weather():
     """Demo weather queries"""
     print_header("DEMO 2: Weather Information")
     
-    assistant = AIOperationsAssistant()
-    
     tasks = [
         "What's the weather like in London?",
         "Get the current weather in Tokyo",
         "Tell me about the weather in New York"
     ]
     
-    for task in tasks:
-        print(f"Task: {task}\n")
-        result = assistant.execute_task(task)
-        print_result(result)
-        time.sleep(2)
+    run_tasks(tasks)
 
 
 def demo_news():
     """Demo news queries"""
     print_header("DEMO 3: News Headlines")
     
-    assistant = AIOperationsAssistant()
-    
     tasks = [
         "Get the latest technology news",
         "Show me recent business headlines",
         "What are the top news stories today?"
     ]
     
-    for task in tasks:
-        print(f"Task: {task}\n")
-        result = assistant.execute_task(task)
-        print_result(result)
-        time.sleep(2)
+    run_tasks(tasks)
 
 
 def demo_exchange_rates():
     """Demo currency exchange rates"""
     print_header("DEMO 4: Currency Exchange Rates")
     
-    assistant = AIOperationsAssistant()
-    
     tasks = [
         "What's the USD to EUR exchange rate?",
         "Convert 100 GBP to JPY",
         "Show me the current EUR to USD rate"
     ]
     
-    for task in tasks:
-        print(f"Task: {task}\n")
-        result = assistant.execute_task(task)
-        print_result(result)
-        time.sleep(2)
+    run_tasks(tasks)
 
 
 def demo_multi_tool():
     """Demo multi-tool orchestration"""
     print_header("DEMO 5: Multi-Tool Orchestration")
     
-    assistant = AIOperationsAssistant()
-    
     tasks = [
         "Find Python web frameworks on GitHub and get the weather in San Francisco",
         "Get the latest tech news and show me AI repositories on GitHub",
         "What's the USD to EUR rate and find finance-related repositories"
     ]
     
-    for task in tasks:
-        print(f"Task: {task}\n")
-        result = assistant.execute_task(task)
-        print_result(result)
-        time.sleep(2)
+    run_tasks(tasks)
 
 
 def main():
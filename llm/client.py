@@ -1,7 +1,62 @@
 import os
-import json
-from typing import Optional, Dict, Any, List
+import re
+import shelve
+import asyncio
+import hashlib
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, Callable, List, Iterator
 from google import genai
+from utils import dumps, loads
+
+logger = logging.getLogger(__name__)
+
+_FENCE_RE = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```", re.S)
+_BRACE_RE = re.compile(r"\{.*\}", re.S)
+
+
+
+class _ObjectScanner:
+    """Incrementally finds the first complete top-level JSON object in a stream"""
+
+    def __init__(self):
+        self.text = ""
+        self._buffer = []
+        self._depth = 0
+        self._started = False
+        self._in_string = False
+        self._escaped = False
+
+    def feed(self, chunk: str) -> bool:
+        # Returns True once the object is complete; self.text then holds it
+        for char in chunk:
+            if not self._started:
+                if char != "{":
+                    continue
+                self._started = True
+
+            self._buffer.append(char)
+
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char == "{":
+                self._depth += 1
+            elif char == "}":
+                self._depth -= 1
+                if self._depth == 0:
+                    self.text = "".join(self._buffer)
+                    return True
+
+        return False
+
 
 class LLMClient:
     """Gemini LLM wrapper (FREE & supported in 2026)"""
@@ -17,7 +72,73 @@ class LLMClient:
         # Or 'gemini-3-flash-preview' for the latest experimental capabilities
         self.model = "gemini-2.5-flash" 
 
+        # Upper bound on concurrent requests issued by batch_generate
+        self.batch_concurrency = 8
+
+        # On-disk response cache, opened on first use. LLM_CACHE=1 turns it on
+        # for every call (e.g. demo re-runs); otherwise only cache=True or
+        # temperature 0 calls use it
+        self.cache_enabled = os.getenv("LLM_CACHE", "0") == "1"
+        self.cache_path = os.path.expanduser(
+            os.getenv("LLM_CACHE_PATH", "~/.cache/ai-ops/llm.shelve")
+        )
+        self._cache = None
+        self._cache_disabled = False
+        self._cache_lock = threading.Lock()
+
     def generate(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        temperature: float = 0.4,
+        max_tokens: int = 2048,
+        json_mode: bool = False,
+        cache: bool = False
+    ) -> str:
+        # Only deterministic calls are cached unless the caller or LLM_CACHE opts in
+        use_cache = cache or self.cache_enabled or temperature == 0
+        if use_cache:
+            key = self._cache_key(prompt, system_prompt, temperature, max_tokens, json_mode)
+            cached = self._cache_get(key)
+            if cached is not None:
+                return cached
+
+        response = self.client.models.generate_content(
+            model=self.model,
+            contents=prompt,
+            config=self._build_config(system_prompt, temperature, max_tokens)
+        )
+
+        text = self._response_text(response, json_mode)
+        if use_cache:
+            self._cache_set(key, text)
+        return text
+
+    def generate_stream(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        temperature: float = 0.4,
+        max_tokens: int = 2048
+    ) -> Iterator[str]:
+        # Yields text chunks as they arrive instead of waiting for the full response
+        stream = self.client.models.generate_content_stream(
+            model=self.model,
+            contents=prompt,
+            config=self._build_config(system_prompt, temperature, max_tokens)
+        )
+
+        try:
+            for chunk in stream:
+                if chunk.text:
+                    yield chunk.text
+        finally:
+            # Stop reading the response if the caller abandons the generator
+            close = getattr(stream, "close", None)
+            if close:
+                close()
+
+    async def _agenerate(
         self,
         prompt: str,
         system_prompt: Optional[str] = None,
@@ -25,19 +146,80 @@ class LLMClient:
         max_tokens: int = 2048,
         json_mode: bool = False
     ) -> str:
-        # For the new SDK, system instructions can be passed in config
+        response = await self.client.aio.models.generate_content(
+            model=self.model,
+            contents=prompt,
+            config=self._build_config(system_prompt, temperature, max_tokens)
+        )
+
+        return self._response_text(response, json_mode)
+
+    def generate_with_tools(
+        self,
+        prompt: str,
+        tools: List[Dict[str, Any]],
+        on_tool_call: Callable[[str, Dict[str, Any]], Any],
+        system_prompt: Optional[str] = None,
+        temperature: float = 0.2,
+        max_tokens: int = 2048,
+        max_turns: int = 6
+    ) -> str:
+        # Native function calling: the model requests tool calls, on_tool_call
+        # services them locally, and the loop ends when the model answers in text
+        declarations = [
+            {
+                "name": tool["name"],
+                "description": tool["description"],
+                "parameters_json_schema": {"type": "object", "properties": tool["parameters"]}
+            }
+            for tool in tools
+        ]
         config = {
+            **self._build_config(system_prompt, temperature, max_tokens),
+            "tools": [{"function_declarations": declarations}],
+            "automatic_function_calling": {"disable": True}
+        }
+        contents = [{"role": "user", "parts": [{"text": prompt}]}]
+
+        for _ in range(max_turns):
+            response = self.client.models.generate_content(
+                model=self.model,
+                contents=contents,
+                config=config
+            )
+
+            calls = response.function_calls
+            if not calls:
+                return self._response_text(response, json_mode=False)
+
+            # Calls requested in the same turn are independent, so run them together
+            args = [dict(call.args or {}) for call in calls]
+            if len(calls) == 1:
+                results = [on_tool_call(calls[0].name, args[0])]
+            else:
+                with ThreadPoolExecutor(max_workers=len(calls)) as pool:
+                    results = list(pool.map(on_tool_call, [call.name for call in calls], args))
+
+            contents.append(response.candidates[0].content)
+            contents.append({
+                "role": "user",
+                "parts": [
+                    {"function_response": {"name": call.name, "response": {"result": result}}}
+                    for call, result in zip(calls, results)
+                ]
+            })
+
+        raise ValueError(f"No final answer after {max_turns} tool-calling turns")
+
+    def _build_config(self, system_prompt, temperature, max_tokens):
+        # For the new SDK, system instructions can be passed in config
+        return {
             "temperature": temperature,
             "max_output_tokens": max_tokens,
             "system_instruction": system_prompt if system_prompt else None
         }
 
-        response = self.client.models.generate_content(
-            model=self.model,
-            contents=prompt,
-            config=config
-        )
-
+    def _response_text(self, response, json_mode):
         # Ensure the response has text before accessing it
         if not response.text:
             raise ValueError("LLM returned an empty response.")
@@ -55,38 +237,134 @@ class LLMClient:
         prompt: str,
         system_prompt: Optional[str] = None,
         schema: Optional[Dict[str, Any]] = None,
-        temperature: float = 0.2
+        temperature: float = 0.2,
+        cache: bool = False
     ) -> Dict[str, Any]:
 
         instruction = "\n\nReturn ONLY valid JSON."
         if schema:
-            instruction += "\nSchema:\n" + json.dumps(schema, indent=2)
+            instruction += "\nSchema:\n" + dumps(schema, indent=True)
+        prompt += instruction
+
+        use_cache = cache or self.cache_enabled or temperature == 0
+        if use_cache:
+            key = self._cache_key(prompt, system_prompt, temperature, 2048, "structured")
+            cached = self._cache_get(key)
+            if cached is not None:
+                return loads(cached)
+
+        text = self._stream_json(prompt, system_prompt, temperature)
+        data = loads(text)
+        if use_cache:
+            self._cache_set(key, text)
+        return data
 
-        raw = self.generate(
+    def generate_structured_multi(
+        self,
+        prompt: str,
+        sections: Dict[str, Dict[str, Any]],
+        system_prompt: Optional[str] = None,
+        temperature: float = 0.2,
+        cache: bool = False
+    ) -> Dict[str, Dict[str, Any]]:
+        # One round-trip returning several named JSON objects
+        names = ", ".join(f'"{name}"' for name in sections)
+        instruction = (
+            f"\n\nRespond with a single JSON object whose top-level keys are {names}."
+            "\nSections:\n" + dumps(sections, indent=True)
+        )
+
+        data = self.generate_structured(
             prompt + instruction,
             system_prompt,
-            temperature,
-            json_mode=True
+            temperature=temperature,
+            cache=cache
         )
 
-        return json.loads(raw)
+        # Models occasionally drop the wrapper and return only the first section
+        if not any(name in data for name in sections):
+            data = {next(iter(sections)): data}
+
+        return {
+            name: data[name] if isinstance(data.get(name), dict) else {}
+            for name in sections
+        }
+
+    def _stream_json(self, prompt, system_prompt, temperature):
+        # Stream the response and stop as soon as the top-level object closes
+        scanner = _ObjectScanner()
+        chunks = []
+        stream = self.generate_stream(prompt, system_prompt, temperature)
+        try:
+            for chunk in stream:
+                chunks.append(chunk)
+                if scanner.feed(chunk):
+                    return scanner.text
+        finally:
+            stream.close()
+
+        text = "".join(chunks).strip()
+        if not text:
+            raise ValueError("LLM returned an empty response.")
+
+        return self._extract_json(text)
+
+    def _cache_key(self, prompt, system_prompt, temperature, max_tokens, json_mode):
+        # Content-addressed: any change to the request produces a new key
+        payload = dumps(
+            [self.model, system_prompt, prompt, temperature, max_tokens, json_mode]
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def _cache_get(self, key):
+        with self._cache_lock:
+            cache = self._open_cache()
+            return cache.get(key) if cache is not None else None
+
+    def _cache_set(self, key, text):
+        with self._cache_lock:
+            cache = self._open_cache()
+            if cache is not None:
+                cache[key] = text
+                cache.sync()
+
+    def _open_cache(self):
+        if self._cache is None and not self._cache_disabled:
+            try:
+                os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+                self._cache = shelve.open(self.cache_path)
+            except Exception as e:
+                logger.warning("LLM response cache disabled: %s", e)
+                self._cache_disabled = True
+        return self._cache
 
     def batch_generate(self, prompts, system_prompt=None, temperature=0.4):
-        return [self.generate(p, system_prompt, temperature) for p in prompts]
+        # Sync entry point; the prompts are sent concurrently
+        return asyncio.run(self._batch(prompts, system_prompt, temperature))
+
+    async def _batch(self, prompts, system_prompt=None, temperature=0.4):
+        # Throttle to stay under the provider's request rate
+        semaphore = asyncio.Semaphore(self.batch_concurrency)
+
+        async def run(prompt):
+            async with semaphore:
+                return await self._agenerate(prompt, system_prompt, temperature)
+
+        return await asyncio.gather(*[run(p) for p in prompts])
 
     def _extract_json(self, text):
-        try:
-            json.loads(text)
+        # Bare JSON object: nothing to strip
+        if text[:1] == "{" and text[-1:] == "}":
             return text
-        except:
-            pass
 
-        if "```" in text:
-            text = text.split("```")[1]
+        # JSON wrapped in a markdown code fence
+        match = _FENCE_RE.search(text)
+        if match:
+            return match.group(1)
 
-        start = text.find("{")
-        end = text.rfind("}") + 1
-        if start != -1 and end != -1:
-            return text[start:end]
+        # JSON embedded in surrounding prose
+        match = _BRACE_RE.search(text)
+        if match:
+            return match.group(0)
 
         raise ValueError("No valid JSON found in LLM output")
@@ -5,32 +5,70 @@ AI Operations Assistant - Main Entry Point
 Supports both CLI and REST API modes
 """
 
+import io
 import os
+import re
 import sys
-import json
+import asyncio
 import logging
-import argparse
-from typing import Dict, Any
-from dotenv import load_dotenv
+import importlib
+import itertools
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import aclosing, asynccontextmanager
+from typing import Dict, Any, AsyncIterator, Callable, Iterator, List, Optional, Tuple
 
 # Setup paths
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from llm import LLMClient
-from agents import PlannerAgent, ExecutorAgent, VerifierAgent
-from tools import get_registry
-from tools.github_tool import GitHubTool
-from tools.weather_tool import WeatherTool
-from tools.news_tool import NewsTool
-from tools.exchange_tool import ExchangeRateTool
+from agents import PlannerAgent, ExecutorAgent, VerifierAgent, StepResult
+from tools import BaseTool, get_registry, io_queue
+from utils import ORJSON_AVAILABLE, dumps
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
 
 # Configure logging
 logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    level=os.getenv("LOG_LEVEL", "INFO").upper(),
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    force=True
 )
 logger = logging.getLogger(__name__)
 
+# Loggers raised to DEBUG by --verbose, leaving third-party libraries at the root level
+APP_LOGGERS = ("agents", "llm", "tools", "utils", __name__)
+
+# Tool name -> (module, class); modules are imported when a tool is first used
+TOOL_FACTORIES = {
+    "github": ("tools.github_tool", "GitHubTool"),
+    "weather": ("tools.weather_tool", "WeatherTool"),
+    "news": ("tools.news_tool", "NewsTool"),
+    "exchange_rate": ("tools.exchange_tool", "ExchangeRateTool")
+}
+
+# Worker threads for blocking work on the API event loop (sync tools, planner and verifier LLM calls)
+API_THREAD_POOL_SIZE = min(32, 4 * (os.cpu_count() or 1))
+
+# System prompt for the single-session function-calling pipeline
+FUNCTION_CALLING_PROMPT = """You are an operations assistant with access to tools.
+Call the tools you need to complete the user's task, then answer in natural language.
+
+Guidelines:
+- Call independent tools in the same turn
+- Be concise and clear in the final answer
+- If a tool fails or data is incomplete, acknowledge it gracefully"""
+
+# Patterns used to guess tool calls from the task text while the planner runs
+_CURRENCY_RE = re.compile(r"\b[A-Z]{3}\b")
+_WEATHER_CITY_RE = re.compile(r"\bweather\b.*?\b(?:in|for|at)\s+([A-Z][\w'.-]*(?:\s+[A-Z][\w'.-]*)*)")
+SPECULATIVE_CURRENCIES = frozenset({
+    "USD", "EUR", "GBP", "JPY", "CNY", "INR", "AUD", "CAD", "CHF", "SEK", "NOK",
+    "DKK", "NZD", "MXN", "SGD", "HKD", "KRW", "BRL", "ZAR", "PLN", "TRY"
+})
+
 
 class AIOperationsAssistant:
     """Main assistant orchestrator"""
@@ -38,13 +76,14 @@ class AIOperationsAssistant:
     def __init__(self):
         """Initialize the AI Operations Assistant"""
         # Load environment variables
+        from dotenv import load_dotenv
         load_dotenv()
         
         # Initialize LLM client
         try:
             self.llm_client = LLMClient()
         except ValueError as e:
-            logger.error(str(e))
+            logger.error("%s", e)
             raise
         
         # Initialize agents
@@ -55,70 +94,372 @@ class AIOperationsAssistant:
         # Register tools
         self._register_tools()
         
+        # Guess likely tool calls from the task and start them alongside planning;
+        # off by default since wrong guesses spend upstream API quota
+        self.speculate = os.getenv("SPECULATIVE_PREFETCH", "0") == "1"
+        
+        # Let the LLM call tools directly in one session instead of plan/execute/verify
+        self.use_function_calling = os.getenv("FUNCTION_CALLING", "0") == "1"
+        
         logger.info("AI Operations Assistant initialized")
     
     def _register_tools(self):
-        """Register all available tools"""
-        registry = get_registry()
+        """Register all available tools, deferring their construction to first use"""
+        get_registry().register_factories({
+            name: _tool_factory(module_name, class_name)
+            for name, (module_name, class_name) in TOOL_FACTORIES.items()
+        })
+    
+    def _speculative_calls(self, task: str) -> List[Tuple[str, Dict[str, Any]]]:
+        """
+        Guess tool calls a task is likely to need from keywords in its text
+        
+        Only calls whose parameters are all named in the task are guessed.
         
-        tools = [
-            GitHubTool(),
-            WeatherTool(),
-            NewsTool(),
-            ExchangeRateTool()
-        ]
+        Args:
+            task: Task description
+            
+        Returns:
+            List of (tool name, parameters) pairs
+        """
+        calls = []
+        
+        # A conversion needs two different currencies; one alone would be a guess
+        currencies = list(dict.fromkeys(
+            code for code in _CURRENCY_RE.findall(task) if code in SPECULATIVE_CURRENCIES
+        ))
+        if len(currencies) >= 2:
+            calls.append(("exchange_rate", {
+                "from_currency": currencies[0],
+                "to_currency": currencies[1]
+            }))
         
-        for tool in tools:
-            registry.register(tool)
+        match = _WEATHER_CITY_RE.search(task)
+        city = match.group(1).rstrip(".'-").strip() if match else ""
+        if city:
+            calls.append(("weather", {"city": city}))
         
-        logger.info(f"Registered {len(tools)} tools")
+        registered = get_registry().list_tools()
+        return [(tool, params) for tool, params in calls if tool in registered]
+    
+    def _start_speculation(self, task: str) -> Optional[asyncio.Future]:
+        """
+        Start prefetching likely tool calls into the executor cache
+        
+        Args:
+            task: Task description
+            
+        Returns:
+            Future of the prefetches, or None if nothing was guessed. Steps
+            join matching prefetches themselves; cancel it once execution ends
+        """
+        if not self.speculate:
+            return None
+        
+        calls = self._speculative_calls(task)
+        if not calls:
+            return None
+        
+        logger.info("Prefetching %d tool calls while planning", len(calls))
+        return asyncio.gather(*[self.executor.prefetch(tool, params) for tool, params in calls])
     
     def execute_task(self, task: str) -> Dict[str, Any]:
         """
         Execute a natural language task
         
+        Blocks until done, even inside a running event loop; async callers
+        should await aexecute_task instead.
+        
         Args:
             task: Task description
             
         Returns:
             Execution results
         """
-        logger.info(f"Executing task: {task}")
+        return io_queue.run(self.aexecute_task(task))
+    
+    async def aexecute_task(self, task: str) -> Dict[str, Any]:
+        """
+        Execute a natural language task without blocking the event loop
+        
+        Several tasks can run concurrently with asyncio.gather.
         
+        Args:
+            task: Task description
+            
+        Returns:
+            Execution results
+        """
+        logger.info("Executing task: %s", task)
+        
+        if self.use_function_calling:
+            return await self._aexecute_with_function_calling(task)
+        
+        speculation = None
         try:
             # Step 1: Plan
             logger.info("Phase 1: Planning")
-            plan = self.planner.plan(task)
+            speculation = self._start_speculation(task)
+            plan = await self.planner.plan_async(task)
             
-            # Step 2: Execute
+            # Step 2: Execute; steps wait only for prefetches they actually use
             logger.info("Phase 2: Execution")
-            execution_results = self.executor.execute(plan)
+            execution_results = await self.executor.aexecute(plan)
+            _cancel_speculation(speculation)
             
             # Step 3: Verify
             logger.info("Phase 3: Verification")
-            verification = self.verifier.verify(task, plan, execution_results)
+            verification = await asyncio.to_thread(
+                self.verifier.verify, task, plan, execution_results
+            )
             
-            # Compile final response
-            response = {
-                "task": task,
-                "status": "success" if verification["verified"] else "partial",
-                "plan": plan,
-                "execution": execution_results,
-                "verification": verification,
-                "final_answer": verification["final_answer"]
-            }
+            response = self._build_response(task, plan, execution_results, verification)
             
             logger.info("Task execution complete")
             return response
             
         except Exception as e:
-            logger.error(f"Task execution failed: {str(e)}")
-            return {
-                "task": task,
-                "status": "error",
-                "error": str(e),
-                "final_answer": f"I encountered an error while processing your request: {str(e)}"
+            logger.error("Task execution failed: %s", e)
+            return self._error_response(task, e)
+        
+        finally:
+            _cancel_speculation(speculation)
+    
+    async def _aexecute_with_function_calling(self, task: str) -> Dict[str, Any]:
+        """
+        Execute a task in a single function-calling session with the LLM
+        
+        The model issues tool calls, which the executor services with its
+        usual retries and caching, and then writes the final answer. The
+        response has the same shape as the plan/execute/verify pipeline's,
+        with the tool calls reported as plan steps.
+        
+        Args:
+            task: Task description
+            
+        Returns:
+            Execution results
+        """
+        loop = asyncio.get_running_loop()
+        step_numbers = itertools.count(1)
+        step_results: List[StepResult] = []
+        
+        def on_tool_call(name: str, args: Dict[str, Any]) -> Any:
+            # Runs in a worker thread; the call itself runs on the event loop
+            future = asyncio.run_coroutine_threadsafe(
+                self.executor.aexecute_tool_call(next(step_numbers), name, args), loop
+            )
+            step_result = future.result()
+            step_results.append(step_result)
+            if step_result.status == "success":
+                return step_result.result
+            return {"success": False, "error": step_result.error}
+        
+        try:
+            final_answer = await asyncio.to_thread(
+                self.llm_client.generate_with_tools,
+                prompt=task,
+                tools=list(get_registry().get_all_specs()),
+                on_tool_call=on_tool_call,
+                system_prompt=FUNCTION_CALLING_PROMPT
+            )
+        except Exception as e:
+            logger.error("Task execution failed: %s", e)
+            return self._error_response(task, e)
+        
+        step_results.sort(key=lambda r: r.step)
+        failed = sum(1 for r in step_results if r.status == "error")
+        plan = {
+            "task_analysis": "Tools selected by the model through function calling",
+            "steps": [
+                {"step_number": r.step, "description": r.description, "tool": r.tool}
+                for r in step_results
+            ],
+            "required_tools": sorted({r.tool for r in step_results})
+        }
+        execution_results = {
+            "total_steps": len(step_results),
+            "successful": len(step_results) - failed,
+            "failed": failed,
+            "results": step_results,
+            "execution_context": {
+                f"step_{r.step}": r.result for r in step_results if r.status == "success"
+            }
+        }
+        verification = {
+            "verified": failed == 0,
+            "completeness": {
+                "is_complete": failed == 0,
+                "reason": "All tool calls succeeded" if failed == 0 else f"{failed} tool calls failed"
+            },
+            "failed_steps": failed,
+            "final_answer": final_answer,
+            "needs_retry": False
+        }
+        
+        logger.info("Task execution complete")
+        return self._build_response(task, plan, execution_results, verification)
+    
+    async def astream_task(self, task: str) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Execute a natural language task, yielding progress events as they happen
+        
+        Events are dictionaries with "event" and "data" keys:
+        "plan" once planning finishes, "tool_result" for each step as it
+        completes, "final_token" for each chunk of the final answer and
+        "done" with the same response aexecute_task returns. Failures end
+        the stream with an "error" event instead of "done". Closing the
+        stream early cancels the execution still in progress.
+        
+        Args:
+            task: Task description
+            
+        Yields:
+            Progress events
+        """
+        logger.info("Streaming task: %s", task)
+        
+        speculation = None
+        execution = None
+        try:
+            logger.info("Phase 1: Planning")
+            speculation = self._start_speculation(task)
+            plan = await self.planner.plan_async(task)
+            yield {"event": "plan", "data": PlannerAgent.without_resolvers(plan)}
+            
+            # Step results are forwarded through a queue as the executor completes them
+            logger.info("Phase 2: Execution")
+            step_queue: asyncio.Queue = asyncio.Queue()
+            execution = asyncio.create_task(self.executor.aexecute(plan, on_step=step_queue.put_nowait))
+            execution.add_done_callback(lambda _: step_queue.put_nowait(None))
+            
+            while (step_result := await step_queue.get()) is not None:
+                yield {"event": "tool_result", "data": step_result.to_dict()}
+            execution_results = execution.result()
+            _cancel_speculation(speculation)
+            
+            logger.info("Phase 3: Verification")
+            verification = None
+            async for event in _iterate_in_thread(
+                self.verifier.verify_stream(task, plan, execution_results)
+            ):
+                if event["event"] == "verification":
+                    verification = event["data"]
+                else:
+                    yield event
+            
+            logger.info("Task execution complete")
+            yield {
+                "event": "done",
+                "data": self._build_response(task, plan, execution_results, verification)
             }
+            
+        except Exception as e:
+            logger.error("Task execution failed: %s", e)
+            yield {"event": "error", "data": self._error_response(task, e)}
+        
+        finally:
+            # Nobody is left to read the results once the consumer goes away
+            if execution is not None and not execution.done():
+                execution.cancel()
+            _cancel_speculation(speculation)
+    
+    def _build_response(
+        self,
+        task: str,
+        plan: Dict[str, Any],
+        execution_results: Dict[str, Any],
+        verification: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Compile the final response for a task
+        
+        Args:
+            task: Task description
+            plan: Execution plan
+            execution_results: Results from Executor Agent
+            verification: Results from Verifier Agent
+            
+        Returns:
+            Execution results
+        """
+        return {
+            "task": task,
+            "status": "success" if verification["verified"] else "partial",
+            "plan": PlannerAgent.without_resolvers(plan),
+            "execution": {
+                **execution_results,
+                "results": [r.to_dict() for r in execution_results["results"]]
+            },
+            "verification": verification,
+            "final_answer": verification["final_answer"]
+        }
+    
+    def _error_response(self, task: str, error: Exception) -> Dict[str, Any]:
+        """
+        Build the response for a task that failed
+        
+        Args:
+            task: Task description
+            error: Exception raised while processing the task
+            
+        Returns:
+            Error response
+        """
+        return {
+            "task": task,
+            "status": "error",
+            "error": str(error),
+            "final_answer": f"I encountered an error while processing your request: {str(error)}"
+        }
+
+
+def _tool_factory(module_name: str, class_name: str) -> Callable[[], BaseTool]:
+    """
+    Build a factory that imports a tool class and returns its shared instance
+    
+    Args:
+        module_name: Module defining the tool
+        class_name: Tool class name
+        
+    Returns:
+        Zero-argument callable returning the process-wide tool instance
+    """
+    def factory() -> BaseTool:
+        return getattr(importlib.import_module(module_name), class_name).get_instance()
+    
+    return factory
+
+
+def _cancel_speculation(speculation: Optional[asyncio.Future]) -> None:
+    """
+    Cancel prefetches that no step used
+    
+    Args:
+        speculation: Future from _start_speculation, or None
+    """
+    if speculation is not None and not speculation.done():
+        speculation.cancel()
+        # Retrieve the outcome so the cancelled gather is not reported as unhandled
+        speculation.add_done_callback(lambda future: future.cancelled() or future.exception())
+
+
+async def _iterate_in_thread(iterator: Iterator[Any]) -> AsyncIterator[Any]:
+    """
+    Consume a blocking iterator from a worker thread
+    
+    Args:
+        iterator: Iterator whose next() may block on I/O
+        
+    Yields:
+        Items from the iterator
+    """
+    sentinel = object()
+    while True:
+        item = await asyncio.to_thread(next, iterator, sentinel)
+        if item is sentinel:
+            break
+        yield item
 
 
 def run_cli(assistant: AIOperationsAssistant, task: str, verbose: bool = False):
@@ -131,67 +472,147 @@ def run_cli(assistant: AIOperationsAssistant, task: str, verbose: bool = False):
         verbose: Whether to show detailed output
     """
     if verbose:
-        logging.getLogger().setLevel(logging.DEBUG)
+        for name in APP_LOGGERS:
+            logging.getLogger(name).setLevel(logging.DEBUG)
     
-    print("\n" + "="*80)
-    print("AI OPERATIONS ASSISTANT")
-    print("="*80)
-    print(f"\nTask: {task}\n")
+    # Header goes out before the task runs, the rest in one write once it finishes
+    rule = "=" * 80
+    sys.stdout.write(f"\n{rule}\nAI OPERATIONS ASSISTANT\n{rule}\n\nTask: {task}\n\n")
+    sys.stdout.flush()
     
     result = assistant.execute_task(task)
     
-    print("\n" + "-"*80)
-    print("FINAL ANSWER")
-    print("-"*80)
-    print(result["final_answer"])
-    print()
+    divider = "-" * 80
+    out = io.StringIO()
+    write = out.write
+    write(f"\n{divider}\nFINAL ANSWER\n{divider}\n{result['final_answer']}\n\n")
     
     if verbose:
-        print("\n" + "-"*80)
-        print("DETAILED RESULTS")
-        print("-"*80)
-        print(json.dumps(result, indent=2, default=str))
-        print()
+        write(f"\n{divider}\nDETAILED RESULTS\n{divider}\n")
+        write(dumps(result, indent=True, default=str))
+        write("\n\n")
     
-    print("Status:", result["status"])
+    write(f"Status: {result['status']}\n")
     if result.get("verification"):
-        print("Verified:", result["verification"].get("verified", False))
-        print("Failed steps:", result["verification"].get("failed_steps", 0))
-    print()
+        write(f"Verified: {result['verification'].get('verified', False)}\n")
+        write(f"Failed steps: {result['verification'].get('failed_steps', 0)}\n")
+    write("\n")
+    
+    sys.stdout.write(out.getvalue())
+    sys.stdout.flush()
 
 
-def run_api(assistant: AIOperationsAssistant, host: str = "localhost", port: int = 8000):
+def create_app(assistant: Optional[AIOperationsAssistant] = None):
     """
-    Run in API mode
+    Build the FastAPI application
+    
+    Used directly for a single worker and as the uvicorn factory for
+    several. Each worker process builds its own assistant on startup, so
+    no state is shared across forks.
     
     Args:
-        assistant: AI Operations Assistant instance
-        host: API host
-        port: API port
+        assistant: Assistant to serve; created at startup when omitted
+        
+    Returns:
+        FastAPI application
     """
-    try:
-        from fastapi import FastAPI, HTTPException
-        from fastapi.responses import JSONResponse
-        from pydantic import BaseModel
-        import uvicorn
-    except ImportError:
-        logger.error("FastAPI not installed. Install with: pip install fastapi uvicorn")
-        sys.exit(1)
+    from fastapi import Depends, FastAPI, HTTPException, Request
+    from fastapi.responses import JSONResponse, ORJSONResponse, StreamingResponse
     
-    app = FastAPI(title="AI Operations Assistant API")
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        # Blocking calls run through asyncio.to_thread; size the pool for I/O-bound work
+        thread_pool = ThreadPoolExecutor(max_workers=API_THREAD_POOL_SIZE, thread_name_prefix="aiops")
+        asyncio.get_running_loop().set_default_executor(thread_pool)
+        
+        app.state.assistant = assistant or AIOperationsAssistant()
+        yield
+        
+        await io_queue.aclose_client()
+        thread_pool.shutdown(wait=False)
     
-    class TaskRequest(BaseModel):
-        task: str
+    # orjson serializes large result payloads several times faster than stdlib json
+    response_class = ORJSONResponse if ORJSON_AVAILABLE else JSONResponse
+    app = FastAPI(
+        title="AI Operations Assistant API",
+        default_response_class=response_class,
+        lifespan=lifespan
+    )
+    
+    # Request bodies are decoded by msgspec when installed, pydantic otherwise
+    if msgspec is not None:
+        class TaskRequest(msgspec.Struct):
+            task: str
+        
+        class BatchRequest(msgspec.Struct):
+            tasks: List[str]
+        
+        def body_parser(model):
+            decoder = msgspec.json.Decoder(model)
+            
+            async def parse(request: Request):
+                try:
+                    return decoder.decode(await request.body())
+                except msgspec.DecodeError as e:
+                    raise HTTPException(status_code=422, detail=str(e))
+            
+            return parse
+    else:
+        from pydantic import BaseModel, ValidationError
+        
+        class TaskRequest(BaseModel):
+            task: str
+        
+        class BatchRequest(BaseModel):
+            tasks: List[str]
+        
+        def body_parser(model):
+            async def parse(request: Request):
+                try:
+                    return model.model_validate_json(await request.body())
+                except ValidationError as e:
+                    raise HTTPException(status_code=422, detail=e.errors())
+            
+            return parse
+    
+    parse_task_request = body_parser(TaskRequest)
+    parse_batch_request = body_parser(BatchRequest)
     
     @app.post("/execute")
-    async def execute_task(request: TaskRequest):
+    async def execute_task(request: TaskRequest = Depends(parse_task_request)):
         """Execute a natural language task"""
         try:
-            result = assistant.execute_task(request.task)
-            return JSONResponse(content=result)
+            result = await app.state.assistant.aexecute_task(request.task)
+            return response_class(content=result)
         except Exception as e:
             raise HTTPException(status_code=500, detail=str(e))
     
+    @app.post("/execute_batch")
+    async def execute_batch(request: BatchRequest = Depends(parse_batch_request)):
+        """Execute several tasks concurrently"""
+        try:
+            results = await asyncio.gather(
+                *[app.state.assistant.aexecute_task(task) for task in request.tasks]
+            )
+            return response_class(content={"results": results})
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=str(e))
+    
+    @app.post("/execute/stream")
+    async def execute_task_stream(request: TaskRequest = Depends(parse_task_request)):
+        """Execute a task, streaming progress as Server-Sent Events"""
+        async def event_source():
+            # Close the task stream as soon as the client disconnects
+            async with aclosing(app.state.assistant.astream_task(request.task)) as events:
+                async for event in events:
+                    yield f"event: {event['event']}\ndata: {dumps(event['data'], default=str)}\n\n"
+        
+        return StreamingResponse(
+            event_source(),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache"}
+        )
+    
     @app.get("/health")
     async def health_check():
         """Health check endpoint"""
@@ -206,12 +627,41 @@ def run_api(assistant: AIOperationsAssistant, host: str = "localhost", port: int
             "specs": registry.get_all_specs()
         }
     
+    return app
+
+
+def run_api(
+    assistant: Optional[AIOperationsAssistant] = None,
+    host: str = "localhost",
+    port: int = 8000,
+    workers: int = 1,
+    limit_concurrency: Optional[int] = None
+):
+    """
+    Run in API mode
+    
+    Args:
+        assistant: AI Operations Assistant instance (single worker only)
+        host: API host
+        port: API port
+        workers: Number of worker processes
+        limit_concurrency: Maximum concurrent connections per worker before returning 503
+    """
+    try:
+        import fastapi  # noqa: F401
+        import uvicorn
+    except ImportError:
+        logger.error("FastAPI not installed. Install with: pip install fastapi uvicorn")
+        sys.exit(1)
+    
     print("\n" + "="*80)
     print("AI OPERATIONS ASSISTANT API")
     print("="*80)
-    print(f"\nServer starting on http://{host}:{port}")
+    print(f"\nServer starting on http://{host}:{port} ({workers} worker{'s' if workers != 1 else ''})")
     print("\nAvailable endpoints:")
     print(f"  POST http://{host}:{port}/execute - Execute a task")
+    print(f"  POST http://{host}:{port}/execute_batch - Execute several tasks concurrently")
+    print(f"  POST http://{host}:{port}/execute/stream - Execute a task, streaming progress (SSE)")
     print(f"  GET  http://{host}:{port}/health - Health check")
     print(f"  GET  http://{host}:{port}/tools - List available tools")
     print("\nExample request:")
@@ -220,11 +670,50 @@ def run_api(assistant: AIOperationsAssistant, host: str = "localhost", port: int
     print('    -d \'{"task": "Find popular AI repositories on GitHub"}\'')
     print("\nPress Ctrl+C to stop\n")
     
-    uvicorn.run(app, host=host, port=port, log_level="info")
+    # "auto" selects uvloop and httptools when they are installed (uvicorn[standard])
+    server_options = {
+        "host": host,
+        "port": port,
+        "loop": "auto",
+        "http": "auto",
+        "limit_concurrency": limit_concurrency,
+        "log_level": "info"
+    }
+    
+    if workers > 1:
+        # The on-disk caches assume a single writer process
+        if os.environ.get("LLM_CACHE") == "1":
+            logger.warning("LLM_CACHE=1 with %d workers: the shelve cache is not safe across processes", workers)
+        
+        # Workers re-import the app from this module, so it is passed by name
+        uvicorn.run("main:create_app", factory=True, workers=workers, **server_options)
+    else:
+        uvicorn.run(create_app(assistant), **server_options)
+
+
+def _create_assistant() -> AIOperationsAssistant:
+    """
+    Create the assistant, exiting if it cannot be initialized
+    
+    Returns:
+        AI Operations Assistant instance
+    """
+    try:
+        return AIOperationsAssistant()
+    except Exception as e:
+        logger.error("Failed to initialize assistant: %s", e)
+        sys.exit(1)
 
 
 def main():
     """Main entry point"""
+    # Fast path for the common `python main.py "task"` invocation: no parser needed
+    if len(sys.argv) == 2 and not sys.argv[1].startswith("-"):
+        run_cli(_create_assistant(), sys.argv[1])
+        return
+    
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description="AI Operations Assistant - Multi-agent AI system for task automation",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -237,6 +726,7 @@ Examples:
   # API mode
   python main.py --api
   python main.py --api --host 0.0.0.0 --port 8080
+  python main.py --api --workers 4
         """
     )
     
@@ -255,6 +745,11 @@ Examples:
         action="store_true",
         help="Enable verbose output with detailed logs"
     )
+    parser.add_argument(
+        "--function-calling",
+        action="store_true",
+        help="Let the LLM call tools directly in one session instead of plan/execute/verify"
+    )
     parser.add_argument(
         "--host",
         default=os.getenv("API_HOST", "localhost"),
@@ -266,6 +761,18 @@ Examples:
         default=int(os.getenv("API_PORT", "8000")),
         help="API port (default: 8000)"
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=int(os.getenv("API_WORKERS", "1")),
+        help="API worker processes (default: 1)"
+    )
+    parser.add_argument(
+        "--limit-concurrency",
+        type=int,
+        default=int(os.getenv("API_LIMIT_CONCURRENCY", "0")) or None,
+        help="Maximum concurrent connections per worker (default: unlimited)"
+    )
     
     args = parser.parse_args()
     
@@ -273,18 +780,21 @@ Examples:
     if not args.api and not args.task:
         parser.error("task is required when not running in API mode")
     
-    # Initialize assistant
-    try:
-        assistant = AIOperationsAssistant()
-    except Exception as e:
-        logger.error(f"Failed to initialize assistant: {str(e)}")
-        sys.exit(1)
+    # Set through the environment so API worker processes inherit it
+    if args.function_calling:
+        os.environ["FUNCTION_CALLING"] = "1"
     
-    # Run in appropriate mode
+    # API workers build their own assistant on startup
     if args.api:
-        run_api(assistant, args.host, args.port)
-    else:
-        run_cli(assistant, args.task, args.verbose)
+        run_api(
+            host=args.host,
+            port=args.port,
+            workers=args.workers,
+            limit_concurrency=args.limit_concurrency
+        )
+        return
+    
+    run_cli(_create_assistant(), args.task, args.verbose)
 
 
 if __name__ == "__main__":
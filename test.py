@@ -145,6 +145,456 @@ def test_agents():
         return False
 
 
+def test_dag_scheduler():
+    """Test concurrent step scheduling in the executor"""
+    print("\nTesting DAG scheduler...")
+    
+    try:
+        import asyncio
+        import time
+        from agents import ExecutorAgent
+        from tools import BaseTool, ToolRegistry, io_queue
+        
+        calls = []
+        
+        class SleepTool(BaseTool):
+            def __init__(self):
+                super().__init__("sleep", "Sleeps, then echoes its parameters")
+            
+            async def ainvoke(self, client, **kwargs):
+                calls.append(kwargs)
+                await asyncio.sleep(0.3)
+                return {"success": True, **kwargs}
+        
+        class FlakyTool(BaseTool):
+            def __init__(self):
+                super().__init__("flaky", "Fails with the given errors, then succeeds")
+                self.errors = []
+            
+            def execute(self, **kwargs):
+                if self.errors:
+                    raise RuntimeError(self.errors.pop(0))
+                return {"success": True}
+        
+        flaky = FlakyTool()
+        executor = ExecutorAgent()
+        executor.tool_registry = ToolRegistry()
+        executor.tool_registry.register_many([SleepTool(), flaky])
+        executor.base_delay = 0.01
+        
+        # Independent steps overlap; a dependent step sees its dependency's result
+        plan = {"steps": [
+            {"step_number": 1, "tool": "sleep", "parameters": {"n": 1}, "depends_on": []},
+            {"step_number": 2, "tool": "sleep", "parameters": {"n": 2}, "depends_on": []},
+            {"step_number": 3, "tool": "sleep", "parameters": {"prev": "$step_1"}, "depends_on": [1]}
+        ]}
+        
+        async def timed_execute():
+            io_queue.get_async_client()  # Client setup is not what is being timed
+            start = time.monotonic()
+            results = await executor.aexecute(plan)
+            return results, time.monotonic() - start
+        
+        results, elapsed = io_queue.run(timed_execute())
+        assert results["successful"] == 3, results
+        # Steps 1 and 2 overlap, so two rounds of 0.3s instead of three
+        assert elapsed < 0.75, f"steps 1 and 2 did not overlap ({elapsed:.2f}s)"
+        print(f"  ✓ Independent steps run concurrently ({elapsed:.2f}s for 3 steps of 0.3s)")
+        
+        assert calls[2]["prev"] == {"success": True, "n": 1}, calls[2]
+        assert [r.step for r in results["results"]] == [1, 2, 3]
+        print("  ✓ $step_N references resolve to earlier results; results keep plan order")
+        
+        # Dependents of a failed step are skipped
+        flaky.errors = ["404 not found"]
+        results = executor.execute({"steps": [
+            {"step_number": 1, "tool": "flaky", "parameters": {}, "no_cache": True, "depends_on": []},
+            {"step_number": 2, "tool": "sleep", "parameters": {"n": 3}, "depends_on": [1]},
+            {"step_number": 3, "tool": "sleep", "parameters": {"n": 4}, "depends_on": [9]}
+        ]})
+        statuses = [r.status for r in results["results"]]
+        assert statuses == ["error", "skipped", "skipped"], statuses
+        assert results["results"][0].attempts == 1, "non-retryable error was retried"
+        print("  ✓ Failed and unknown dependencies skip their dependents; 404 is not retried")
+        
+        # Transient errors are retried up to max_retries
+        flaky.errors = ["connection reset", "timeout"]
+        result = executor.execute({"steps": [
+            {"step_number": 1, "tool": "flaky", "parameters": {}, "no_cache": True}
+        ]})["results"][0]
+        assert result.status == "success" and result.attempts == 3, result
+        flaky.errors = ["connection reset"] * 3
+        result = executor.execute({"steps": [
+            {"step_number": 1, "tool": "flaky", "parameters": {}, "no_cache": True}
+        ]})["results"][0]
+        assert result.status == "error" and result.attempts == 3, result
+        print("  ✓ Transient errors are retried, up to max_retries attempts")
+        
+        return True
+    except Exception as e:
+        print(f"  ✗ DAG scheduler test failed: {e!r}")
+        return False
+
+
+def test_executor_cache():
+    """Test the executor's per-tool result cache"""
+    print("\nTesting executor result cache...")
+    
+    try:
+        from agents import ExecutorAgent
+        from agents.executor import TOOL_CACHE_MAX_ENTRIES
+        from tools import BaseTool, ToolRegistry
+        
+        calls = []
+        
+        class CountingTool(BaseTool):
+            def __init__(self):
+                super().__init__("counting", "Counts its calls")
+            
+            def execute(self, n=0, fail=False, **kwargs):
+                calls.append(n)
+                return {"success": not fail, "n": n}
+        
+        executor = ExecutorAgent()
+        executor.tool_registry = ToolRegistry()
+        executor.tool_registry.register(CountingTool())
+        
+        step = {"step_number": 1, "tool": "counting", "parameters": {"n": 1}}
+        first = executor.execute({"steps": [step]})["results"][0]
+        second = executor.execute({"steps": [step]})["results"][0]
+        assert len(calls) == 1, calls
+        assert not first.cached and second.cached and second.result == first.result
+        print("  ✓ Repeated tool calls are served from the cache")
+        
+        failing = {"step_number": 1, "tool": "counting", "parameters": {"n": 2, "fail": True}}
+        executor.execute({"steps": [failing]})
+        executor.execute({"steps": [failing]})
+        assert calls.count(2) == 2, calls
+        print("  ✓ Results reporting success=False are not cached")
+        
+        cache = executor._tool_cache("counting")
+        for n in range(TOOL_CACHE_MAX_ENTRIES + 10):
+            executor._store_cached("counting", executor._cache_key("counting", {"n": n}), {"n": n})
+        assert len(cache) == TOOL_CACHE_MAX_ENTRIES, len(cache)
+        print(f"  ✓ Cache is bounded at {TOOL_CACHE_MAX_ENTRIES} entries per tool")
+        
+        return True
+    except Exception as e:
+        print(f"  ✗ Executor cache test failed: {e!r}")
+        return False
+
+
+def test_step_result():
+    """Test StepResult serialization"""
+    print("\nTesting StepResult...")
+    
+    try:
+        import dataclasses
+        from agents import StepResult
+        
+        full = StepResult(
+            step=1, status="success", description="Look up", tool="weather",
+            result={"temp": 10}, attempts=2, cached=True
+        )
+        assert full.to_dict() == {
+            "step": 1, "description": "Look up", "tool": "weather", "status": "success",
+            "result": {"temp": 10}, "attempts": 2, "cached": True
+        }, full.to_dict()
+        assert list(full.to_dict()) == ["step", "description", "tool", "status", "result", "attempts", "cached"]
+        print("  ✓ to_dict keeps the response key order")
+        
+        skipped = StepResult(step=3, status="skipped", reason="Dependencies not met")
+        assert skipped.to_dict() == {"step": 3, "status": "skipped", "reason": "Dependencies not met"}
+        error = StepResult(step=2, status="error", tool="news", error="boom", attempts=1)
+        assert error.to_dict() == {"step": 2, "tool": "news", "status": "error", "error": "boom", "attempts": 1}
+        print("  ✓ Unset fields and cached=False are omitted")
+        
+        try:
+            full.status = "error"
+        except dataclasses.FrozenInstanceError:
+            print("  ✓ StepResult is immutable")
+        else:
+            raise AssertionError("StepResult fields can be reassigned")
+        
+        return True
+    except Exception as e:
+        print(f"  ✗ StepResult test failed: {e!r}")
+        return False
+
+
+def test_plan_cache():
+    """Test the persistent plan cache"""
+    print("\nTesting plan cache...")
+    
+    try:
+        import json
+        import tempfile
+        import threading
+        import time
+        from agents import PlannerAgent
+        from agents import planner as planner_module
+        
+        class NoLLM:
+            def __getattr__(self, name):
+                raise AssertionError("the LLM was called on a cache hit")
+        
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "plans.json")
+            
+            def fresh_planner():
+                planner = PlannerAgent(NoLLM())
+                planner.plan_cache_path = path
+                return planner
+            
+            planner = fresh_planner()
+            task = "Weather in Paris"
+            plan = {"steps": [{"step_number": 1, "tool": "weather", "parameters": {"city": "Paris"}, "depends_on": []}]}
+            planner._compile_resolvers(plan)
+            planner._store_cached_plan(planner._cache_key(task, planner._get_tool_specs()[1]), plan)
+            
+            with open(path) as f:
+                stored = json.load(f)
+            assert "_resolvers" not in json.dumps(stored), stored
+            cached = fresh_planner().plan(task)
+            assert cached["steps"][0]["_resolvers"] == [["city", False, "Paris"]], cached
+            print("  ✓ Plans are reused across planners without an LLM call; resolvers are recompiled")
+            
+            # Concurrent saves each replace the file whole
+            threads = [
+                threading.Thread(target=planner._store_cached_plan, args=(f"task {n}", {"steps": []}))
+                for n in range(20)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            with open(path) as f:
+                stored = json.load(f)
+            assert len(stored) == 21, len(stored)
+            assert os.listdir(directory) == ["plans.json"], os.listdir(directory)
+            print("  ✓ Concurrent saves keep every entry and leave no temporary files")
+            
+            # Expired entries are neither loaded nor served
+            stored["task 0"]["created_at"] = time.time() - planner_module.PLAN_CACHE_TTL - 1
+            with open(path, "w") as f:
+                json.dump(stored, f)
+            reloaded = fresh_planner()
+            assert reloaded._get_cached_plan("task 0") is None
+            assert reloaded._get_cached_plan("task 1") is not None
+            
+            ttl = planner_module.PLAN_CACHE_TTL
+            planner_module.PLAN_CACHE_TTL = 0
+            try:
+                assert reloaded._get_cached_plan("task 1") is None
+            finally:
+                planner_module.PLAN_CACHE_TTL = ttl
+            print("  ✓ Entries older than PLAN_CACHE_TTL are dropped")
+        
+        return True
+    except Exception as e:
+        print(f"  ✗ Plan cache test failed: {e!r}")
+        return False
+
+
+def test_ttl_cache():
+    """Test TTL expiry, LRU eviction and the stale window of TTLCache"""
+    print("\nTesting TTLCache...")
+    
+    try:
+        import time
+        from utils import TTLCache
+        
+        cache = TTLCache(ttl=0.1, maxsize=2, stale_ttl=0.2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        assert cache.get("a") == 1  # "a" is now the most recently used
+        cache.set("c", 3)
+        assert cache.get("b") is None and cache.get("a") == 1 and cache.get("c") == 3
+        print("  ✓ The least recently used entry is evicted when full")
+        
+        time.sleep(0.15)
+        assert cache.get("a") is None and cache.get("a", "miss") == "miss"
+        assert cache.get_stale("a") == 1
+        print("  ✓ Expired entries miss on get() but are served by get_stale()")
+        
+        time.sleep(0.2)
+        assert cache.get_stale("a") is None
+        assert len(cache) == 1  # Only "c" is left until it is looked up
+        print("  ✓ Entries past the stale window are dropped")
+        
+        fresh = TTLCache(ttl=60)
+        fresh.set("k", "v")
+        assert fresh.get("k") == "v" and fresh.get_stale("k") == "v"
+        fresh.clear()
+        assert fresh.get("k") is None and len(fresh) == 0
+        print("  ✓ Live entries are served by both lookups; clear() empties the cache")
+        
+        return True
+    except Exception as e:
+        print(f"  ✗ TTLCache test failed: {e!r}")
+        return False
+
+
+def test_circuit_breaker():
+    """Test the closed -> open -> half-open cycle of CircuitBreaker"""
+    print("\nTesting circuit breaker...")
+    
+    try:
+        import asyncio
+        import threading
+        import time
+        from tools._breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, CircuitOpenError
+        
+        def fail():
+            raise ConnectionError("upstream down")
+        
+        breaker = CircuitBreaker("test", failure_threshold=3, recovery_timeout=0.1)
+        for _ in range(2):
+            try:
+                breaker.call(fail)
+            except ConnectionError:
+                pass
+        assert breaker.state == CLOSED
+        assert breaker.call(lambda: "ok") == "ok"
+        print("  ✓ Failures below the threshold keep the circuit closed; a success resets the count")
+        
+        for _ in range(3):
+            try:
+                breaker.call(fail)
+            except ConnectionError:
+                pass
+        assert breaker.state == OPEN
+        try:
+            breaker.call(lambda: "ok")
+        except CircuitOpenError:
+            print("  ✓ The circuit opens at the threshold and rejects calls")
+        else:
+            raise AssertionError("open circuit let a call through")
+        
+        # After the cool-down exactly one probe goes through
+        time.sleep(0.15)
+        probe_started = threading.Event()
+        release_probe = threading.Event()
+        
+        def slow_probe():
+            probe_started.set()
+            release_probe.wait(2)
+            return "recovered"
+        
+        results = []
+        prober = threading.Thread(target=lambda: results.append(breaker.call(slow_probe)))
+        prober.start()
+        probe_started.wait(2)
+        assert breaker.state == HALF_OPEN
+        try:
+            breaker.call(lambda: "second probe")
+        except CircuitOpenError:
+            pass
+        else:
+            raise AssertionError("a second probe ran while half-open")
+        release_probe.set()
+        prober.join()
+        assert results == ["recovered"] and breaker.state == CLOSED
+        print("  ✓ Half-open allows a single probe; its success closes the circuit")
+        
+        for _ in range(3):
+            try:
+                breaker.call(fail)
+            except ConnectionError:
+                pass
+        time.sleep(0.15)
+        try:
+            breaker.call(fail)
+        except ConnectionError:
+            pass
+        assert breaker.state == OPEN
+        print("  ✓ A failed probe re-opens the circuit")
+        
+        # A cancelled async probe hands the half-open slot back
+        time.sleep(0.15)
+        
+        async def cancelled_probe():
+            probe = asyncio.ensure_future(breaker.acall(lambda: asyncio.sleep(10)))
+            await asyncio.sleep(0.01)
+            probe.cancel()
+            try:
+                await probe
+            except asyncio.CancelledError:
+                pass
+            return await breaker.acall(lambda: asyncio.sleep(0, "recovered"))
+        
+        assert asyncio.run(cancelled_probe()) == "recovered" and breaker.state == CLOSED
+        print("  ✓ A cancelled probe does not leave the circuit stuck half-open")
+        
+        return True
+    except Exception as e:
+        print(f"  ✗ Circuit breaker test failed: {e!r}")
+        return False
+
+
+def test_single_flight():
+    """Test that SingleFlight and AsyncSingleFlight collapse concurrent calls"""
+    print("\nTesting single-flight deduplication...")
+    
+    try:
+        import asyncio
+        import time
+        from concurrent.futures import ThreadPoolExecutor
+        from utils import AsyncSingleFlight, SingleFlight
+        
+        calls = []
+        
+        def fetch(key):
+            calls.append(key)
+            time.sleep(0.2)
+            if key == "bad":
+                raise ValueError("upstream error")
+            return key.upper()
+        
+        flights = SingleFlight()
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            futures = [pool.submit(flights.do, key, lambda key=key: fetch(key)) for key in ["a"] * 5 + ["b"] * 3]
+            results = [future.result() for future in futures]
+        assert results == ["A"] * 5 + ["B"] * 3, results
+        assert sorted(calls) == ["a", "b"], calls
+        print("  ✓ Concurrent threads share one call per key")
+        
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            futures = [pool.submit(flights.do, "bad", lambda: fetch("bad")) for _ in range(4)]
+            errors = [type(future.exception()).__name__ for future in futures]
+        assert errors == ["ValueError"] * 4 and calls.count("bad") == 1, (errors, calls)
+        assert flights.do("a", lambda: fetch("a")) == "A" and calls.count("a") == 2
+        print("  ✓ The error reaches every waiter; finished keys run again")
+        
+        async_calls = []
+        
+        async def afetch(key):
+            async_calls.append(key)
+            await asyncio.sleep(0.1)
+            return key.upper()
+        
+        async def run_async():
+            aflights = AsyncSingleFlight()
+            results = await asyncio.gather(*[aflights.do(key, lambda key=key: afetch(key)) for key in "aaab"])
+            assert results == ["A", "A", "A", "B"], results
+            assert sorted(async_calls) == ["a", "b"], async_calls
+            
+            # A waiter that is cancelled does not cancel the shared call
+            first = asyncio.ensure_future(aflights.do("c", lambda: afetch("c")))
+            second = asyncio.ensure_future(aflights.do("c", lambda: afetch("c")))
+            await asyncio.sleep(0.01)
+            first.cancel()
+            assert await second == "C" and async_calls.count("c") == 1
+        
+        asyncio.run(run_async())
+        print("  ✓ Concurrent coroutines share one task per key; cancelling one waiter spares the rest")
+        
+        return True
+    except Exception as e:
+        print(f"  ✗ Single-flight test failed: {e!r}")
+        return False
+
+
 def test_github_tool():
     """Test GitHub tool"""
     print("\nTesting GitHub tool...")
@@ -185,7 +635,7 @@ def test_weather_tool():
         result = tool.execute(city="London")
         if result.get("success"):
             print("  ✓ Weather fetch works")
-            print(f"    {result['city']}: {result['weather']['temperature']}")
+            print(f"    {result['city']}: {result['weather']['temperature']}{result['units']['temperature']}")
         else:
             print(f"  ℹ Weather fetch: {result.get('message', 'using fallback')}")
         
@@ -261,6 +711,13 @@ def main():
         ("LLM Client", test_llm_client),
         ("Tool Registry", test_tool_registry),
         ("Agents", test_agents),
+        ("DAG Scheduler", test_dag_scheduler),
+        ("Executor Cache", test_executor_cache),
+        ("StepResult", test_step_result),
+        ("Plan Cache", test_plan_cache),
+        ("TTL Cache", test_ttl_cache),
+        ("Circuit Breaker", test_circuit_breaker),
+        ("Single Flight", test_single_flight),
         ("GitHub Tool", test_github_tool),
         ("Weather Tool", test_weather_tool),
         ("Exchange Rate Tool", test_exchange_tool),
@@ -2,15 +2,26 @@
 Base tool classes and tool registry for AI Operations Assistant
 """
 
-from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Callable, Iterable, Optional, Tuple
+from urllib.parse import urlsplit
+import asyncio
+import inspect
 import logging
+import threading
+
+from utils import loads
+from .io_queue import get_async_client, submit
 
 logger = logging.getLogger(__name__)
 
+# Guards creation of the per-class shared instances returned by get_instance()
+_INSTANCE_LOCK = threading.Lock()
+
 
-class BaseTool(ABC):
-    """Abstract base class for all tools"""
+class BaseTool:
+    """Base class for all tools"""
+    
+    __slots__ = ("name", "description", "parameters")
     
     def __init__(self, name: str, description: str, parameters: Optional[Dict[str, Any]] = None):
         """
@@ -25,18 +36,209 @@ class BaseTool(ABC):
         self.description = description
         self.parameters = parameters or {}
     
-    @abstractmethod
     def execute(self, **kwargs) -> Dict[str, Any]:
         """
         Execute the tool with given parameters
         
+        Subclasses must override this.
+        
+        Args:
+            **kwargs: Tool-specific parameters
+            
+        Returns:
+            Tool execution results
+        """
+        raise NotImplementedError(f"{self.__class__.__name__} does not implement execute()")
+    
+    async def ainvoke(self, client: Any, **kwargs) -> Dict[str, Any]:
+        """
+        Execute the tool without blocking the event loop
+        
+        Tools with native async I/O override this and use the shared
+        client. The default runs execute() in a worker thread.
+        
         Args:
+            client: Shared httpx.AsyncClient, or None if httpx is unavailable
             **kwargs: Tool-specific parameters
             
         Returns:
             Tool execution results
         """
-        pass
+        return await asyncio.to_thread(self.execute, **kwargs)
+    
+    def _http_get(
+        self,
+        url: str,
+        params: Optional[Any] = None,
+        headers: Optional[Dict[str, str]] = None
+    ) -> Any:
+        """
+        GET through the shared session and the host's circuit breaker
+        
+        Retries come from the shared session; the timeout is the tool's
+        timeout attribute when it has one. Server errors count against the
+        breaker and are raised; other responses are returned as they are.
+        
+        Args:
+            url: Request URL
+            params: Query parameters
+            headers: Extra request headers
+            
+        Returns:
+            requests response
+            
+        Raises:
+            requests.exceptions.RequestException: On network errors, server
+                errors or an open circuit
+        """
+        # Imported here so registering tools lazily does not pull in requests
+        from ._breaker import get_breaker
+        from ._http import DEFAULT_TIMEOUT, get_session
+        
+        timeout = getattr(self, "timeout", DEFAULT_TIMEOUT)
+        
+        def fetch() -> Any:
+            response = get_session().get(url, params=params, headers=headers, timeout=timeout)
+            if response.status_code >= 500:
+                response.raise_for_status()
+            return response
+        
+        return get_breaker(urlsplit(url).hostname).call(fetch)
+    
+    async def _ahttp_get(
+        self,
+        client: Any,
+        url: str,
+        params: Optional[Any] = None,
+        headers: Optional[Dict[str, str]] = None
+    ) -> Any:
+        """
+        Async counterpart of _http_get using the shared httpx client
+        
+        Requests are retried with the same policy as the sync session.
+        
+        Args:
+            client: Shared httpx.AsyncClient
+            url: Request URL
+            params: Query parameters
+            headers: Extra request headers
+            
+        Returns:
+            httpx response
+            
+        Raises:
+            httpx.HTTPError: On network or server errors
+            CircuitOpenError: If the host's circuit is open
+        """
+        import httpx
+        from ._breaker import get_breaker
+        from ._http import DEFAULT_TIMEOUT, aget
+        
+        connect, read = getattr(self, "timeout", DEFAULT_TIMEOUT)
+        timeout = httpx.Timeout(read, connect=connect)
+        
+        async def fetch() -> Any:
+            response = await aget(client, url, params=params, timeout=timeout, headers=headers)
+            if response.status_code >= 500:
+                response.raise_for_status()
+            return response
+        
+        return await get_breaker(urlsplit(url).hostname).acall(fetch)
+    
+    def _http_json(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        transform: Optional[Callable[[Any], Any]] = None,
+        fallback: Optional[Callable[[Exception], Any]] = None
+    ) -> Any:
+        """
+        GET a JSON document with _http_get
+        
+        Network errors, open circuits, error statuses and malformed
+        payloads (including errors raised by transform) are handed to fallback.
+        
+        Args:
+            url: Request URL
+            params: Query parameters
+            transform: Applied to the parsed JSON before returning it
+            fallback: Called with the error to produce the result on failure;
+                the error is re-raised if not given
+            
+        Returns:
+            Transformed JSON document, or the fallback result
+        """
+        import requests
+        
+        try:
+            response = self._http_get(url, params=params)
+            response.raise_for_status()
+            data = loads(response.content)
+            return transform(data) if transform else data
+            
+        except (requests.exceptions.RequestException, ValueError, LookupError, TypeError) as e:
+            if fallback is None:
+                raise
+            return fallback(e)
+    
+    async def _ahttp_json(
+        self,
+        client: Any,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        transform: Optional[Callable[[Any], Any]] = None,
+        fallback: Optional[Callable[[Exception], Any]] = None
+    ) -> Any:
+        """
+        Async counterpart of _http_json using _ahttp_get
+        
+        Args:
+            client: Shared httpx.AsyncClient
+            url: Request URL
+            params: Query parameters
+            transform: Applied to the parsed JSON before returning it
+            fallback: Called with the error to produce the result on failure;
+                may return an awaitable. The error is re-raised if not given
+            
+        Returns:
+            Transformed JSON document, or the fallback result
+        """
+        import httpx
+        from ._breaker import CircuitOpenError
+        
+        try:
+            response = await self._ahttp_get(client, url, params=params)
+            response.raise_for_status()
+            data = loads(response.content)
+            return transform(data) if transform else data
+            
+        except (httpx.HTTPError, CircuitOpenError, ValueError, LookupError, TypeError) as e:
+            if fallback is None:
+                raise
+            result = fallback(e)
+            if inspect.isawaitable(result):
+                result = await result
+            return result
+    
+    @classmethod
+    def get_instance(cls) -> "BaseTool":
+        """
+        Get the process-wide instance of this tool class
+        
+        Tools hold sessions, caches and precomputed request templates, so
+        one instance is shared instead of being rebuilt by every caller.
+        
+        Returns:
+            Shared instance, created on first use
+        """
+        instance = cls.__dict__.get("_instance")
+        if instance is None:
+            with _INSTANCE_LOCK:
+                instance = cls.__dict__.get("_instance")
+                if instance is None:
+                    instance = cls()
+                    cls._instance = instance
+        return instance
     
     def get_spec(self) -> Dict[str, Any]:
         """
@@ -58,9 +260,18 @@ class BaseTool(ABC):
 class ToolRegistry:
     """Registry for managing available tools"""
     
+    __slots__ = ("tools", "_factories", "_instantiate_lock", "version", "_specs_cache", "_names_cache")
+    
     def __init__(self):
         """Initialize empty tool registry"""
-        self.tools: Dict[str, BaseTool] = {}
+        self.tools: Dict[str, BaseTool] = {}  # Instantiated tools
+        self._factories: Dict[str, Callable[[], BaseTool]] = {}  # Every registered name, in order
+        self._instantiate_lock = threading.Lock()
+        self.version = 0  # Bumped whenever the set of tools changes
+        
+        # Built on first request and dropped whenever a tool is registered
+        self._specs_cache: Optional[Tuple[Dict[str, Any], ...]] = None
+        self._names_cache: Optional[Tuple[str, ...]] = None
     
     def register(self, tool: BaseTool) -> None:
         """
@@ -70,11 +281,56 @@ class ToolRegistry:
             tool: Tool instance to register
         """
         self.tools[tool.name] = tool
-        logger.info(f"Registered tool: {tool.name}")
+        self._factories[tool.name] = lambda: tool
+        self._invalidate()
+        logger.debug("Registered tool: %s", tool.name)
+    
+    def register_many(self, tools: Iterable[BaseTool]) -> None:
+        """
+        Register several tools, logging them as one record
+        
+        Args:
+            tools: Tool instances to register
+        """
+        names = []
+        for tool in tools:
+            self.register(tool)
+            names.append(tool.name)
+        logger.info("Registered %d tools: %s", len(names), ", ".join(names))
+    
+    def register_factory(self, name: str, factory: Callable[[], BaseTool]) -> None:
+        """
+        Register a tool that is constructed on first use
+        
+        Args:
+            name: Tool name, matching the name the tool reports
+            factory: Zero-argument callable returning the tool instance
+        """
+        self.tools.pop(name, None)
+        self._factories[name] = factory
+        self._invalidate()
+        logger.debug("Registered tool factory: %s", name)
+    
+    def register_factories(self, factories: Dict[str, Callable[[], BaseTool]]) -> None:
+        """
+        Register several lazily constructed tools, logging them as one record
+        
+        Args:
+            factories: Mapping of tool name to zero-argument factory
+        """
+        for name, factory in factories.items():
+            self.register_factory(name, factory)
+        logger.info("Registered %d tools: %s", len(factories), ", ".join(factories))
+    
+    def _invalidate(self) -> None:
+        """Record a change to the set of tools and drop memoized listings"""
+        self.version += 1
+        self._specs_cache = None
+        self._names_cache = None
     
     def get(self, name: str) -> Optional[BaseTool]:
         """
-        Get a tool by name
+        Get a tool by name, constructing it on first access
         
         Args:
             name: Tool name
@@ -82,25 +338,36 @@ class ToolRegistry:
         Returns:
             Tool instance or None
         """
-        return self.tools.get(name)
+        tool = self.tools.get(name)
+        if tool is None and name in self._factories:
+            with self._instantiate_lock:
+                tool = self.tools.get(name)
+                if tool is None:
+                    tool = self._factories[name]()
+                    self.tools[name] = tool
+        return tool
     
-    def get_all_specs(self) -> List[Dict[str, Any]]:
+    def get_all_specs(self) -> Tuple[Dict[str, Any], ...]:
         """
         Get specifications for all registered tools
         
         Returns:
-            List of tool specifications
+            Tuple of tool specifications, shared between callers
         """
-        return [tool.get_spec() for tool in self.tools.values()]
+        if self._specs_cache is None:
+            self._specs_cache = tuple(self.get(name).get_spec() for name in self._factories)
+        return self._specs_cache
     
-    def list_tools(self) -> List[str]:
+    def list_tools(self) -> Tuple[str, ...]:
         """
-        Get list of registered tool names
+        Get registered tool names
         
         Returns:
-            List of tool names
+            Tuple of tool names
         """
-        return list(self.tools.keys())
+        if self._names_cache is None:
+            self._names_cache = tuple(self._factories)
+        return self._names_cache
     
     def execute_tool(self, name: str, **kwargs) -> Dict[str, Any]:
         """
@@ -118,12 +385,36 @@ class ToolRegistry:
             raise ValueError(f"Tool not found: {name}")
         
         try:
-            logger.info(f"Executing tool: {name} with params: {kwargs}")
+            logger.info("Executing tool: %s with params: %s", name, kwargs)
             result = tool.execute(**kwargs)
-            logger.info(f"Tool {name} completed successfully")
+            logger.info("Tool %s completed successfully", name)
+            return result
+        except Exception as e:
+            logger.error("Tool %s failed: %s", name, e)
+            raise
+    
+    async def aexecute_tool(self, name: str, **kwargs) -> Dict[str, Any]:
+        """
+        Execute a tool by name on the running event loop
+        
+        Args:
+            name: Tool name
+            **kwargs: Tool parameters
+            
+        Returns:
+            Tool execution results
+        """
+        tool = self.get(name)
+        if not tool:
+            raise ValueError(f"Tool not found: {name}")
+        
+        try:
+            logger.info("Executing tool: %s with params: %s", name, kwargs)
+            result = await submit(tool.ainvoke, get_async_client(), **kwargs)
+            logger.info("Tool %s completed successfully", name)
             return result
         except Exception as e:
-            logger.error(f"Tool {name} failed: {str(e)}")
+            logger.error("Tool %s failed: %s", name, e)
             raise
 
 
@@ -0,0 +1,157 @@
+"""
+Per-host circuit breakers - stop calling an upstream API that keeps failing
+"""
+
+import time
+import threading
+from typing import Any, Awaitable, Callable, Dict
+
+import requests
+
+# Consecutive failures that open the circuit, and seconds before a probe
+FAILURE_THRESHOLD = 5
+RECOVERY_TIMEOUT = 30.0
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(requests.exceptions.RequestException):
+    """Raised instead of calling an upstream whose circuit is open"""
+
+
+class CircuitBreaker:
+    """Thread-safe CLOSED -> OPEN -> HALF_OPEN circuit breaker"""
+    
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = FAILURE_THRESHOLD,
+        recovery_timeout: float = RECOVERY_TIMEOUT
+    ):
+        """
+        Initialize breaker
+        
+        Args:
+            name: Name of the protected upstream, used in error messages
+            failure_threshold: Consecutive failures before the circuit opens
+            recovery_timeout: Seconds the circuit stays open before a probe
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._lock = threading.Lock()
+    
+    def call(self, func: Callable[[], Any]) -> Any:
+        """
+        Run func unless the circuit is open
+        
+        While half-open only one caller probes the upstream; the others are
+        rejected until the probe succeeds or re-opens the circuit.
+        
+        Args:
+            func: Zero-argument callable performing the upstream request
+        
+        Returns:
+            Whatever func returns
+        
+        Raises:
+            CircuitOpenError: If the circuit is open
+        """
+        self._before_call()
+        try:
+            result = func()
+        except Exception:
+            self._record_failure()
+            raise
+        except BaseException:
+            self._release_probe()
+            raise
+        
+        self._record_success()
+        return result
+    
+    async def acall(self, func: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Await func unless the circuit is open
+        
+        Async counterpart of call(). A cancelled probe hands the half-open
+        slot back instead of counting as a failure.
+        
+        Args:
+            func: Zero-argument callable returning the upstream request awaitable
+            
+        Returns:
+            Whatever the awaitable resolves to
+            
+        Raises:
+            CircuitOpenError: If the circuit is open
+        """
+        self._before_call()
+        try:
+            result = await func()
+        except Exception:
+            self._record_failure()
+            raise
+        except BaseException:
+            self._release_probe()
+            raise
+        
+        self._record_success()
+        return result
+    
+    def _before_call(self):
+        """Reject the call if open, or move to half-open once the cool-down passed"""
+        with self._lock:
+            if self.state == OPEN:
+                if time.monotonic() - self._opened_at < self.recovery_timeout:
+                    raise CircuitOpenError(f"Circuit for {self.name} is open")
+                self.state = HALF_OPEN
+            elif self.state == HALF_OPEN:
+                raise CircuitOpenError(f"Circuit for {self.name} is half-open")
+    
+    def _record_success(self):
+        """Close the circuit and reset the failure count"""
+        with self._lock:
+            self.state = CLOSED
+            self._failures = 0
+    
+    def _release_probe(self):
+        """Return to OPEN after an interrupted probe so the next caller can probe again"""
+        with self._lock:
+            if self.state == HALF_OPEN:
+                # _opened_at is already past the cool-down, so the next call probes
+                self.state = OPEN
+    
+    def _record_failure(self):
+        """Count a failure and open the circuit once the threshold is hit"""
+        with self._lock:
+            self._failures += 1
+            if self.state == HALF_OPEN or self._failures >= self.failure_threshold:
+                self.state = OPEN
+                self._opened_at = time.monotonic()
+
+
+_BREAKERS: Dict[str, CircuitBreaker] = {}
+_BREAKERS_LOCK = threading.Lock()
+
+
+def get_breaker(host: str) -> CircuitBreaker:
+    """
+    Get the process-wide breaker for an upstream host
+    
+    Args:
+        host: Upstream host name (e.g., 'newsapi.org')
+    
+    Returns:
+        Circuit breaker shared by every caller of that host
+    """
+    with _BREAKERS_LOCK:
+        breaker = _BREAKERS.get(host)
+        if breaker is None:
+            breaker = _BREAKERS[host] = CircuitBreaker(host)
+        return breaker
@@ -0,0 +1,225 @@
+"""
+Shared HTTP session for synchronous tool calls - keep-alive connection pooling,
+plus the same retry policy for requests made on the shared async client
+"""
+
+import asyncio
+import os
+import random
+from typing import Any, Dict, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import MaxRetryError, ResponseError
+from urllib3.util.retry import Retry
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+# Connection pools kept per host, and connections kept per pool
+POOL_CONNECTIONS = 10
+POOL_MAXSIZE = 20
+
+# Transient failures retried by the session; other 4xx responses are final
+RETRY_TOTAL = 3
+RETRY_BACKOFF_FACTOR = 1.0
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+# Longest wait before a retry; a larger Retry-After fails the call at once
+# instead of stalling the request
+RETRY_BACKOFF_MAX = 5.0
+
+# (connect, read) timeout in seconds; connect slightly above a TCP retransmit window
+DEFAULT_TIMEOUT = (3.05, 5.0)
+
+DEFAULT_HEADERS = {
+    "User-Agent": "ai-operations-assistant",
+    "Accept": "application/json"
+}
+
+
+class JitteredRetry(Retry):
+    """Retry policy whose exponential backoff is stretched by up to 50% at random"""
+    
+    def get_backoff_time(self) -> float:
+        """
+        Compute the delay before the next retry
+        
+        Returns:
+            Backoff delay in seconds, at most RETRY_BACKOFF_MAX
+        """
+        return min(RETRY_BACKOFF_MAX, super().get_backoff_time() * (1 + random.random() * 0.5))
+    
+    def increment(self, method=None, url=None, response=None, error=None, _pool=None, _stacktrace=None):
+        """
+        Count a retry, giving up at once if the server asks to wait longer than RETRY_BACKOFF_MAX
+        
+        Args:
+            method: Request method
+            url: Request URL
+            response: Response that triggered the retry, if any
+            error: Error that triggered the retry, if any
+            _pool: Connection pool making the request
+            _stacktrace: Traceback of error
+            
+        Returns:
+            Retry state for the next attempt
+            
+        Raises:
+            MaxRetryError: If retries are exhausted or Retry-After is too long
+        """
+        if response is not None:
+            retry_after = self.get_retry_after(response)
+            if retry_after is not None and retry_after > RETRY_BACKOFF_MAX:
+                raise MaxRetryError(_pool, url, ResponseError(f"Retry-After of {retry_after:g}s is too long"))
+        return super().increment(method, url, response, error, _pool, _stacktrace)
+
+
+def _build_session() -> requests.Session:
+    """
+    Create a session with pooled keep-alive connections and retries
+    
+    GET requests are retried on connection errors, timeouts and the
+    status codes in RETRY_STATUS_CODES, with jittered exponential backoff.
+    
+    Returns:
+        Configured requests session
+    """
+    session = requests.Session()
+    session.headers.update(DEFAULT_HEADERS)
+    retry = JitteredRetry(
+        total=RETRY_TOTAL,
+        backoff_factor=RETRY_BACKOFF_FACTOR,
+        status_forcelist=RETRY_STATUS_CODES,
+        allowed_methods=frozenset({"GET"}),
+        respect_retry_after_header=True
+    )
+    adapter = HTTPAdapter(
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=POOL_MAXSIZE,
+        max_retries=retry
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def _backoff_delay(errors: int) -> float:
+    """
+    Jittered exponential backoff matching JitteredRetry
+    
+    Args:
+        errors: Consecutive failed attempts so far
+        
+    Returns:
+        Delay in seconds before the next attempt
+    """
+    if errors <= 1:
+        return 0.0
+    delay = RETRY_BACKOFF_FACTOR * (2 ** (errors - 1))
+    return min(RETRY_BACKOFF_MAX, delay * (1 + random.random() * 0.5))
+
+
+def _retry_after(response: Any) -> Optional[float]:
+    """
+    Read a Retry-After header given in seconds
+    
+    Args:
+        response: httpx response
+        
+    Returns:
+        Seconds to wait, or None if absent or not a number
+    """
+    value = response.headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None
+
+
+async def aget(
+    client: Any,
+    url: str,
+    params: Optional[Dict[str, Any]] = None,
+    timeout: Any = None,
+    headers: Optional[Dict[str, str]] = None
+) -> Any:
+    """
+    GET on the shared async client with the session's retry policy
+    
+    Connection errors, timeouts and RETRY_STATUS_CODES responses are
+    retried up to RETRY_TOTAL times with jittered exponential backoff,
+    honouring Retry-After. The last response is returned once retries
+    run out, or at once when Retry-After exceeds RETRY_BACKOFF_MAX, so
+    the caller sees its status.
+    
+    Args:
+        client: Shared httpx.AsyncClient
+        url: Request URL
+        params: Query parameters
+        timeout: httpx timeout for each attempt
+        headers: Extra request headers
+        
+    Returns:
+        httpx response
+    """
+    errors = 0
+    while True:
+        try:
+            response = await client.get(url, params=params, headers=headers, timeout=timeout)
+        except httpx.TransportError:
+            errors += 1
+            if errors > RETRY_TOTAL:
+                raise
+            await asyncio.sleep(_backoff_delay(errors))
+            continue
+        
+        if response.status_code not in RETRY_STATUS_CODES or errors >= RETRY_TOTAL:
+            return response
+        
+        delay = _retry_after(response)
+        if delay is not None and delay > RETRY_BACKOFF_MAX:
+            return response
+        
+        errors += 1
+        await asyncio.sleep(_backoff_delay(errors) if delay is None else delay)
+
+
+def timeout_from_env(name: str) -> Tuple[float, float]:
+    """
+    Read a (connect, read) timeout from an environment variable
+    
+    Accepts either "connect,read" or a single number used for both.
+    
+    Args:
+        name: Environment variable name
+        
+    Returns:
+        Timeout tuple, DEFAULT_TIMEOUT if the variable is unset or invalid
+    """
+    value = os.getenv(name)
+    if not value:
+        return DEFAULT_TIMEOUT
+    
+    try:
+        parts = [float(part) for part in value.split(",")]
+    except ValueError:
+        return DEFAULT_TIMEOUT
+    
+    if len(parts) == 1:
+        return (parts[0], parts[0])
+    if len(parts) == 2:
+        return (parts[0], parts[1])
+    return DEFAULT_TIMEOUT
+
+
+_SESSION = _build_session()
+
+
+def get_session() -> requests.Session:
+    """Get the process-wide HTTP session shared by the tools"""
+    return _SESSION
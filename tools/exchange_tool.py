@@ -2,9 +2,13 @@
 Exchange Rate Tool - Get currency exchange rates
 """
 
-import requests
 from typing import Dict, Any
 from tools import BaseTool
+from tools._http import timeout_from_env
+from utils import TTLCache
+
+# Rate tables keyed by source currency; conversion is applied per call
+_RATES_CACHE = TTLCache(ttl=60, maxsize=256)
 
 
 class ExchangeRateTool(BaseTool):
@@ -34,6 +38,7 @@ class ExchangeRateTool(BaseTool):
         
         # Using exchangerate-api.com free tier (no API key required)
         self.base_url = "https://api.exchangerate-api.com/v4/latest"
+        self.timeout = timeout_from_env("EXCHANGE_TOOL_TIMEOUT")
     
     def execute(
         self,
@@ -56,35 +61,129 @@ class ExchangeRateTool(BaseTool):
         from_currency = from_currency.upper()
         to_currency = to_currency.upper()
         
-        try:
-            # Get exchange rates for source currency
-            url = f"{self.base_url}/{from_currency}"
-            response = requests.get(url, timeout=10)
-            response.raise_for_status()
-            data = response.json()
+        data = _RATES_CACHE.get(from_currency)
+        if data is not None:
+            return self._convert(data, from_currency, to_currency, amount)
+        
+        # Get exchange rates for source currency
+        return self._http_json(
+            f"{self.base_url}/{from_currency}",
+            transform=lambda data: self._convert_fetched(data, from_currency, to_currency, amount),
+            fallback=self._unavailable
+        )
+    
+    async def ainvoke(
+        self,
+        client: Any,
+        from_currency: str,
+        to_currency: str,
+        amount: float = 1,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Get exchange rate and convert amount using the shared async client
+        
+        Args:
+            client: Shared httpx.AsyncClient, or None to fall back to a thread
+            from_currency: Source currency code
+            to_currency: Target currency code
+            amount: Amount to convert
             
-            if to_currency not in data["rates"]:
-                return {
-                    "success": False,
-                    "error": f"Currency code '{to_currency}' not found"
-                }
+        Returns:
+            Exchange rate and converted amount
+        """
+        if client is None:
+            return await super().ainvoke(
+                client, from_currency=from_currency, to_currency=to_currency, amount=amount, **kwargs
+            )
+        
+        from_currency = from_currency.upper()
+        to_currency = to_currency.upper()
+        
+        data = _RATES_CACHE.get(from_currency)
+        if data is not None:
+            return self._convert(data, from_currency, to_currency, amount)
+        
+        return await self._ahttp_json(
+            client,
+            f"{self.base_url}/{from_currency}",
+            transform=lambda data: self._convert_fetched(data, from_currency, to_currency, amount),
+            fallback=self._unavailable
+        )
+    
+    def _convert_fetched(
+        self,
+        data: Dict[str, Any],
+        from_currency: str,
+        to_currency: str,
+        amount: float
+    ) -> Dict[str, Any]:
+        """
+        Convert with a freshly fetched rates response, caching it once it parsed
+        
+        Args:
+            data: Parsed rates response for the source currency
+            from_currency: Source currency code
+            to_currency: Target currency code
+            amount: Amount to convert
             
-            rate = data["rates"][to_currency]
-            converted_amount = amount * rate
+        Returns:
+            Exchange rate and converted amount
+        """
+        result = self._convert(data, from_currency, to_currency, amount)
+        _RATES_CACHE.set(from_currency, data)
+        return result
+    
+    def _unavailable(self, error: Exception) -> Dict[str, Any]:
+        """
+        Build the result returned when the rates could not be fetched
+        
+        Args:
+            error: Error raised while fetching or parsing the rates
             
-            return {
-                "success": True,
-                "from_currency": from_currency,
-                "to_currency": to_currency,
-                "exchange_rate": rate,
-                "amount": amount,
-                "converted_amount": round(converted_amount, 2),
-                "conversion": f"{amount} {from_currency} = {converted_amount:.2f} {to_currency}",
-                "last_updated": data["date"]
-            }
+        Returns:
+            Error result
+        """
+        return {
+            "success": False,
+            "error": f"Unable to fetch exchange rates: {str(error)}"
+        }
+    
+    def _convert(
+        self,
+        data: Dict[str, Any],
+        from_currency: str,
+        to_currency: str,
+        amount: float
+    ) -> Dict[str, Any]:
+        """
+        Build the conversion result from an exchange rates response
+        
+        Args:
+            data: Parsed rates response for the source currency
+            from_currency: Source currency code
+            to_currency: Target currency code
+            amount: Amount to convert
             
-        except requests.exceptions.RequestException as e:
+        Returns:
+            Exchange rate and converted amount
+        """
+        if to_currency not in data["rates"]:
             return {
                 "success": False,
-                "error": f"Unable to fetch exchange rates: {str(e)}"
+                "error": f"Currency code '{to_currency}' not found"
             }
+        
+        rate = data["rates"][to_currency]
+        converted_amount = amount * rate
+        
+        return {
+            "success": True,
+            "from_currency": from_currency,
+            "to_currency": to_currency,
+            "exchange_rate": rate,
+            "amount": amount,
+            "converted_amount": converted_amount,  # Full precision; rounded only for display
+            "conversion": f"{amount:,.2f} {from_currency} = {converted_amount:,.2f} {to_currency}",
+            "last_updated": data["date"]
+        }
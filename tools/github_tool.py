@@ -4,8 +4,26 @@ GitHub Tool - Search repositories and get repository information
 
 import os
 import requests
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from tools import BaseTool
+from tools._breaker import CircuitOpenError
+from tools._http import timeout_from_env
+from utils import TTLCache
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+# Query parameters as ordered (name, value) pairs
+QueryParams = Tuple[Tuple[str, Any], ...]
+
+# Search and repository lookups are idempotent; reuse them for five minutes
+_RESPONSE_CACHE = TTLCache(ttl=300, maxsize=256)
+
+# Validators and bodies of earlier responses, for conditional requests
+# once the response cache has expired; GitHub answers unchanged ones with 304
+_VALIDATOR_CACHE = TTLCache(ttl=3600, maxsize=256)
 
 
 class GitHubTool(BaseTool):
@@ -51,6 +69,9 @@ class GitHubTool(BaseTool):
             self.headers["Authorization"] = f"token {self.token}"
         
         self.base_url = "https://api.github.com"
+        self._search_url = f"{self.base_url}/search/repositories"
+        self._repo_url_prefix = f"{self.base_url}/repos/"
+        self.timeout = timeout_from_env("GITHUB_TOOL_TIMEOUT")
     
     def execute(self, action: str = "search", **kwargs) -> Dict[str, Any]:
         """
@@ -70,6 +91,28 @@ class GitHubTool(BaseTool):
         else:
             raise ValueError(f"Unknown action: {action}")
     
+    async def ainvoke(self, client: Any, action: str = "search", **kwargs) -> Dict[str, Any]:
+        """
+        Execute GitHub tool action using the shared async client
+        
+        Args:
+            client: Shared httpx.AsyncClient, or None to fall back to a thread
+            action: Action to perform
+            **kwargs: Action-specific parameters
+            
+        Returns:
+            Action results
+        """
+        if client is None:
+            return await super().ainvoke(client, action=action, **kwargs)
+        
+        if action == "search":
+            return await self._asearch_repositories(client, **kwargs)
+        elif action == "get_repo":
+            return await self._aget_repository(client, **kwargs)
+        else:
+            raise ValueError(f"Unknown action: {action}")
+    
     def _search_repositories(
         self,
         query: str,
@@ -88,45 +131,203 @@ class GitHubTool(BaseTool):
         Returns:
             Search results
         """
-        url = f"{self.base_url}/search/repositories"
-        params = {
-            "q": query,
-            "sort": sort,
-            "order": "desc",
-            "per_page": min(limit, 100)
-        }
+        cache_key = ("search", query, limit, sort)
+        cached = _RESPONSE_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        url = self._search_url
+        params = self._search_params(query, limit, sort)
         
         try:
-            response = requests.get(url, headers=self.headers, params=params, timeout=10)
-            response.raise_for_status()
-            data = response.json()
-            
-            repositories = []
-            for repo in data.get("items", [])[:limit]:
-                repositories.append({
-                    "name": repo["name"],
-                    "full_name": repo["full_name"],
-                    "description": repo["description"],
-                    "stars": repo["stargazers_count"],
-                    "forks": repo["forks_count"],
-                    "language": repo["language"],
-                    "url": repo["html_url"],
-                    "updated_at": repo["updated_at"]
-                })
+            data = self._get_json(url, params)
             
+        except requests.exceptions.RequestException as e:
             return {
-                "success": True,
-                "query": query,
-                "total_count": data.get("total_count", 0),
-                "repositories": repositories
+                "success": False,
+                "error": str(e),
+                "repositories": []
             }
+        
+        result = self._format_search(data, query, limit)
+        _RESPONSE_CACHE.set(cache_key, result)
+        return result
+    
+    async def _asearch_repositories(
+        self,
+        client: Any,
+        query: str,
+        limit: int = 5,
+        sort: str = "stars",
+        **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Search GitHub repositories asynchronously
+        
+        Args:
+            client: Shared httpx.AsyncClient
+            query: Search query
+            limit: Maximum results
+            sort: Sort criterion
             
-        except requests.exceptions.RequestException as e:
+        Returns:
+            Search results
+        """
+        cache_key = ("search", query, limit, sort)
+        cached = _RESPONSE_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        url = self._search_url
+        params = self._search_params(query, limit, sort)
+        
+        try:
+            data = await self._aget_json(client, url, params)
+            
+        except (httpx.HTTPError, CircuitOpenError) as e:
             return {
                 "success": False,
                 "error": str(e),
                 "repositories": []
             }
+        
+        result = self._format_search(data, query, limit)
+        _RESPONSE_CACHE.set(cache_key, result)
+        return result
+    
+    def _get_json(self, url: str, params: Optional[QueryParams] = None) -> Any:
+        """
+        GET a JSON document, revalidating a previously seen response
+        
+        Args:
+            url: Request URL
+            params: Query parameters
+            
+        Returns:
+            Parsed response body
+        """
+        key, headers, cached = self._conditional_headers(url, params)
+        response = self._http_get(url, params=params, headers={**self.headers, **headers})
+        if response.status_code == 304 and cached is not None:
+            return cached[2]
+        
+        response.raise_for_status()
+        data = response.json()
+        self._remember_validators(key, response.headers, data)
+        return data
+    
+    async def _aget_json(self, client: Any, url: str, params: Optional[QueryParams] = None) -> Any:
+        """
+        GET a JSON document on the shared async client, revalidating a previously seen response
+        
+        Args:
+            client: Shared httpx.AsyncClient
+            url: Request URL
+            params: Query parameters
+            
+        Returns:
+            Parsed response body
+        """
+        key, headers, cached = self._conditional_headers(url, params)
+        response = await self._ahttp_get(client, url, params=params, headers={**self.headers, **headers})
+        if response.status_code == 304 and cached is not None:
+            return cached[2]
+        
+        response.raise_for_status()
+        data = response.json()
+        self._remember_validators(key, response.headers, data)
+        return data
+    
+    def _conditional_headers(
+        self,
+        url: str,
+        params: Optional[QueryParams]
+    ) -> Tuple[Tuple, Dict[str, str], Optional[Tuple]]:
+        """
+        Look up validators for a request
+        
+        Args:
+            url: Request URL
+            params: Query parameters
+            
+        Returns:
+            Tuple of (cache key, conditional headers, cached (etag, last_modified, body) or None)
+        """
+        key = (url, params or ())
+        cached = _VALIDATOR_CACHE.get(key)
+        headers = {}
+        if cached is not None:
+            etag, last_modified, _ = cached
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+        return key, headers, cached
+    
+    def _remember_validators(self, key: Tuple, response_headers: Any, data: Any) -> None:
+        """
+        Store a response's validators and body for later revalidation
+        
+        Args:
+            key: Cache key from _conditional_headers
+            response_headers: Response headers
+            data: Parsed response body
+        """
+        etag = response_headers.get("ETag")
+        last_modified = response_headers.get("Last-Modified")
+        if etag or last_modified:
+            _VALIDATOR_CACHE.set(key, (etag, last_modified, data))
+    
+    def _search_params(self, query: str, limit: int, sort: str) -> QueryParams:
+        """
+        Build query parameters for a repository search
+        
+        Args:
+            query: Search query
+            limit: Maximum results
+            sort: Sort criterion
+            
+        Returns:
+            Query parameters as (name, value) pairs
+        """
+        return (
+            ("q", query),
+            ("sort", sort),
+            ("order", "desc"),
+            ("per_page", min(limit, 100))
+        )
+    
+    def _format_search(self, data: Dict[str, Any], query: str, limit: int) -> Dict[str, Any]:
+        """
+        Build the search result from a GitHub search response
+        
+        Args:
+            data: Parsed search response
+            query: Search query
+            limit: Maximum results
+            
+        Returns:
+            Search results
+        """
+        repositories = []
+        for repo in data.get("items", [])[:limit]:
+            repositories.append({
+                "name": repo["name"],
+                "full_name": repo["full_name"],
+                "description": repo["description"],
+                "stars": repo["stargazers_count"],
+                "forks": repo["forks_count"],
+                "language": repo["language"],
+                "url": repo["html_url"],
+                "updated_at": repo["updated_at"]
+            })
+        
+        return {
+            "success": True,
+            "query": query,
+            "total_count": data.get("total_count", 0),
+            "repositories": repositories
+        }
     
     def _get_repository(self, repo: str, **kwargs) -> Dict[str, Any]:
         """
@@ -138,33 +339,81 @@ class GitHubTool(BaseTool):
         Returns:
             Repository details
         """
-        url = f"{self.base_url}/repos/{repo}"
+        cache_key = ("repo", repo)
+        cached = _RESPONSE_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        url = self._repo_url_prefix + repo
         
         try:
-            response = requests.get(url, headers=self.headers, timeout=10)
-            response.raise_for_status()
-            data = response.json()
+            data = self._get_json(url)
             
+        except requests.exceptions.RequestException as e:
             return {
-                "success": True,
-                "repository": {
-                    "name": data["name"],
-                    "full_name": data["full_name"],
-                    "description": data["description"],
-                    "stars": data["stargazers_count"],
-                    "forks": data["forks_count"],
-                    "watchers": data["watchers_count"],
-                    "language": data["language"],
-                    "url": data["html_url"],
-                    "created_at": data["created_at"],
-                    "updated_at": data["updated_at"],
-                    "topics": data.get("topics", []),
-                    "license": data.get("license", {}).get("name") if data.get("license") else None
-                }
+                "success": False,
+                "error": str(e)
             }
+        
+        result = self._format_repository(data)
+        _RESPONSE_CACHE.set(cache_key, result)
+        return result
+    
+    async def _aget_repository(self, client: Any, repo: str, **kwargs) -> Dict[str, Any]:
+        """
+        Get detailed information about a specific repository asynchronously
+        
+        Args:
+            client: Shared httpx.AsyncClient
+            repo: Repository in format 'owner/repo'
             
-        except requests.exceptions.RequestException as e:
+        Returns:
+            Repository details
+        """
+        cache_key = ("repo", repo)
+        cached = _RESPONSE_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        url = self._repo_url_prefix + repo
+        
+        try:
+            data = await self._aget_json(client, url)
+            
+        except (httpx.HTTPError, CircuitOpenError) as e:
             return {
                 "success": False,
                 "error": str(e)
             }
+        
+        result = self._format_repository(data)
+        _RESPONSE_CACHE.set(cache_key, result)
+        return result
+    
+    def _format_repository(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Build the repository result from a GitHub repository response
+        
+        Args:
+            data: Parsed repository response
+            
+        Returns:
+            Repository details
+        """
+        return {
+            "success": True,
+            "repository": {
+                "name": data["name"],
+                "full_name": data["full_name"],
+                "description": data["description"],
+                "stars": data["stargazers_count"],
+                "forks": data["forks_count"],
+                "watchers": data["watchers_count"],
+                "language": data["language"],
+                "url": data["html_url"],
+                "created_at": data["created_at"],
+                "updated_at": data["updated_at"],
+                "topics": data.get("topics", []),
+                "license": data.get("license", {}).get("name") if data.get("license") else None
+            }
+        }
@@ -0,0 +1,120 @@
+"""
+Shared async I/O for tool calls - one pooled HTTP client per event loop
+"""
+
+import asyncio
+import logging
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Optional
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    import h2  # noqa: F401 - only needed to enable HTTP/2 in httpx
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Connection pool limits for the shared client
+MAX_CONNECTIONS = 64
+MAX_KEEPALIVE_CONNECTIONS = 32
+
+# Upper bound on tool I/O in flight on one event loop
+MAX_IN_FLIGHT = 64
+
+# httpx clients and semaphores are bound to the loop they were created on,
+# so each running loop gets its own; entries vanish when the loop is collected
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Any]" = weakref.WeakKeyDictionary()
+_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = weakref.WeakKeyDictionary()
+
+
+def get_async_client() -> Optional["httpx.AsyncClient"]:
+    """
+    Get the shared HTTP client for the running event loop
+    
+    Returns:
+        Pooled httpx.AsyncClient, or None if httpx is not installed
+    """
+    if httpx is None:
+        return None
+    
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(
+                max_connections=MAX_CONNECTIONS,
+                max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS
+            )
+        )
+        _clients[loop] = client
+        logger.debug("Created shared async HTTP client (http2=%s)", HTTP2_AVAILABLE)
+    return client
+
+
+async def submit(call: Callable[..., Awaitable[Any]], *args, **kwargs) -> Any:
+    """
+    Run an I/O coroutine through the shared submission gate
+    
+    Bounds the number of concurrent tool calls on the running loop.
+    
+    Args:
+        call: Coroutine function to run
+        *args: Positional arguments for call
+        **kwargs: Keyword arguments for call
+        
+    Returns:
+        Result of the call
+    """
+    loop = asyncio.get_running_loop()
+    semaphore = _semaphores.get(loop)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(MAX_IN_FLIGHT)
+        _semaphores[loop] = semaphore
+    
+    async with semaphore:
+        return await call(*args, **kwargs)
+
+
+async def aclose_client() -> None:
+    """Close the shared HTTP client of the running event loop, if any"""
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+def run(coro: Awaitable[Any]) -> Any:
+    """
+    Run a coroutine on a fresh event loop, as asyncio.run does
+    
+    The loop's shared HTTP client is closed before the loop shuts down, so
+    its pooled connections are not left open. Called from a thread that is
+    already running a loop (e.g. Jupyter), the coroutine runs on a worker
+    thread instead of failing; the caller blocks until it finishes.
+    
+    Args:
+        coro: Coroutine to run
+        
+    Returns:
+        Result of the coroutine
+    """
+    async def main():
+        try:
+            return await coro
+        finally:
+            await aclose_client()
+    
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(main())
+    
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="io-queue-run") as pool:
+        return pool.submit(asyncio.run, main()).result()
@@ -3,44 +3,69 @@ News Tool - Get latest news headlines from various sources
 """
 
 import os
-import requests
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from tools import BaseTool
+from tools._http import timeout_from_env
+from utils import AsyncSingleFlight, SingleFlight, TTLCache
+
+
+# Successful API responses keyed by (category, country, query, limit); expired
+# entries are kept for ten minutes so an outage serves them instead of mock data
+_NEWS_CACHE = TTLCache(ttl=60, maxsize=128, stale_ttl=600)
+_NEWS_FLIGHTS = SingleFlight()
+_NEWS_AFLIGHTS = AsyncSingleFlight()
 
 
 class NewsTool(BaseTool):
     """Tool for fetching news headlines"""
     
+    # Static tool metadata, built once at import and shared by every instance
+    _NAME = "news"
+    _DESCRIPTION = "Get latest news headlines from various sources and categories"
+    _PARAMETERS = {
+        "category": {
+            "type": "string",
+            "description": "News category: general, business, technology, science, health, sports, entertainment",
+            "default": "general"
+        },
+        "country": {
+            "type": "string",
+            "description": "Country code (e.g., 'us', 'gb', 'ca')",
+            "default": "us"
+        },
+        "query": {
+            "type": "string",
+            "description": "Search query for specific news topics (optional)"
+        },
+        "limit": {
+            "type": "integer",
+            "description": "Maximum number of articles to return (default: 5)",
+            "default": 5
+        }
+    }
+    
     def __init__(self):
         """Initialize News tool"""
         super().__init__(
-            name="news",
-            description="Get latest news headlines from various sources and categories",
-            parameters={
-                "category": {
-                    "type": "string",
-                    "description": "News category: general, business, technology, science, health, sports, entertainment",
-                    "default": "general"
-                },
-                "country": {
-                    "type": "string",
-                    "description": "Country code (e.g., 'us', 'gb', 'ca')",
-                    "default": "us"
-                },
-                "query": {
-                    "type": "string",
-                    "description": "Search query for specific news topics (optional)"
-                },
-                "limit": {
-                    "type": "integer",
-                    "description": "Maximum number of articles to return (default: 5)",
-                    "default": 5
-                }
-            }
+            name=self._NAME,
+            description=self._DESCRIPTION,
+            parameters=self._PARAMETERS
         )
         
         self.api_key = os.getenv("NEWS_API_KEY")
         self.base_url = "https://newsapi.org/v2"
+        
+        # Endpoints and constant query parameters, built once per instance
+        self._everything_url = f"{self.base_url}/everything"
+        self._headlines_url = f"{self.base_url}/top-headlines"
+        self._everything_params_base = {
+            "apiKey": self.api_key,
+            "sortBy": "publishedAt",
+            "language": "en",
+            "page": 1
+        }
+        self._headlines_params_base = {"apiKey": self.api_key, "page": 1}
+        self.timeout = timeout_from_env("NEWS_TOOL_TIMEOUT")
     
     def execute(
         self,
@@ -66,52 +91,205 @@ class NewsTool(BaseTool):
             # Fallback to free RSS/API aggregator
             return self._get_news_fallback(category, limit)
         
+        cache_key = (category, country, query, limit)
+        cached = _NEWS_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        # Concurrent misses for the same query share one upstream request
+        result = _NEWS_FLIGHTS.do(
+            cache_key,
+            lambda: self._fetch_news(category, country, query, limit)
+        )
+        return self._cache_result(cache_key, result, category, limit)
+    
+    async def ainvoke(
+        self,
+        client: Any,
+        category: str = "general",
+        country: str = "us",
+        query: Optional[str] = None,
+        limit: int = 5,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Get news headlines using the shared async client
+        
+        Args:
+            client: Shared httpx.AsyncClient, or None to fall back to a thread
+            category: News category
+            country: Country code
+            query: Search query (optional)
+            limit: Maximum articles
+            
+        Returns:
+            News headlines
+        """
+        if client is None:
+            return await super().ainvoke(
+                client, category=category, country=country, query=query, limit=limit, **kwargs
+            )
+        
+        if not self.api_key:
+            return self._get_news_fallback(category, limit)
+        
+        cache_key = (category, country, query, limit)
+        cached = _NEWS_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        result = await _NEWS_AFLIGHTS.do(
+            cache_key,
+            lambda: self._afetch_news(client, category, country, query, limit)
+        )
+        return self._cache_result(cache_key, result, category, limit)
+    
+    def _cache_result(
+        self,
+        cache_key: Tuple[Any, ...],
+        result: Optional[Dict[str, Any]],
+        category: str,
+        limit: int
+    ) -> Dict[str, Any]:
+        """
+        Cache a successful fetch, or substitute the last good one on failure
+        
+        Args:
+            cache_key: (category, country, query, limit) key
+            result: Freshly fetched headlines, or None if the fetch failed
+            category: News category, for the fallback source
+            limit: Maximum articles, for the fallback source
+            
+        Returns:
+            News headlines to return to the caller
+        """
+        if result is not None:
+            _NEWS_CACHE.set(cache_key, result)
+            return result
+        
+        stale = _NEWS_CACHE.get_stale(cache_key)
+        if stale is not None:
+            return {**stale, "stale": True}
+        
+        return self._get_news_fallback(category, limit)
+    
+    def _request_for(
+        self,
+        category: str,
+        country: str,
+        query: Optional[str],
+        limit: int
+    ) -> Tuple[str, Dict[str, Any]]:
+        """
+        Pick the NewsAPI endpoint and query parameters for a request
+        
+        Args:
+            category: News category
+            country: Country code
+            query: Search query (optional)
+            limit: Maximum articles
+            
+        Returns:
+            Endpoint URL and query parameters
+        """
         # Use different endpoint based on whether we have a query
         if query:
-            endpoint = f"{self.base_url}/everything"
-            params = {
-                "q": query,
-                "apiKey": self.api_key,
-                "pageSize": limit,
-                "sortBy": "publishedAt",
-                "language": "en"
-            }
-        else:
-            endpoint = f"{self.base_url}/top-headlines"
-            params = {
-                "category": category,
-                "country": country,
-                "apiKey": self.api_key,
-                "pageSize": limit
-            }
+            return self._everything_url, {**self._everything_params_base, "q": query, "pageSize": limit}
         
-        try:
-            response = requests.get(endpoint, params=params, timeout=10)
-            response.raise_for_status()
-            data = response.json()
-            
-            if data.get("status") != "ok":
-                return self._get_news_fallback(category, limit)
+        return self._headlines_url, {
+            **self._headlines_params_base,
+            "category": category,
+            "country": country,
+            "pageSize": limit
+        }
+    
+    def _fetch_news(
+        self,
+        category: str,
+        country: str,
+        query: Optional[str],
+        limit: int
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Fetch headlines from NewsAPI
+        
+        Args:
+            category: News category
+            country: Country code
+            query: Search query (optional)
+            limit: Maximum articles
             
-            articles = []
-            for article in data.get("articles", [])[:limit]:
-                articles.append({
-                    "title": article["title"],
-                    "description": article.get("description", ""),
-                    "source": article["source"]["name"],
-                    "url": article["url"],
-                    "published_at": article["publishedAt"],
-                    "author": article.get("author")
-                })
+        Returns:
+            News headlines, or None if the API call failed
+        """
+        endpoint, params = self._request_for(category, country, query, limit)
+        return self._http_json(
+            endpoint,
+            params=params,
+            transform=lambda data: self._format_news(data, limit),
+            fallback=lambda error: None
+        )
+    
+    async def _afetch_news(
+        self,
+        client: Any,
+        category: str,
+        country: str,
+        query: Optional[str],
+        limit: int
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Async counterpart of _fetch_news
+        
+        Args:
+            client: Shared httpx.AsyncClient
+            category: News category
+            country: Country code
+            query: Search query (optional)
+            limit: Maximum articles
             
-            return {
-                "success": True,
-                "total_results": data.get("totalResults", 0),
-                "articles": articles
-            }
+        Returns:
+            News headlines, or None if the API call failed
+        """
+        endpoint, params = self._request_for(category, country, query, limit)
+        return await self._ahttp_json(
+            client,
+            endpoint,
+            params=params,
+            transform=lambda data: self._format_news(data, limit),
+            fallback=lambda error: None
+        )
+    
+    def _format_news(self, data: Dict[str, Any], limit: int) -> Optional[Dict[str, Any]]:
+        """
+        Build the tool result from a NewsAPI response
+        
+        Args:
+            data: Parsed NewsAPI response
+            limit: Maximum articles
             
-        except requests.exceptions.RequestException as e:
-            return self._get_news_fallback(category, limit)
+        Returns:
+            News headlines, or None if NewsAPI reported an error
+        """
+        if data.get("status") != "ok":
+            return None
+        
+        articles = []
+        for article in data.get("articles", [])[:limit]:
+            articles.append({
+                "title": article["title"],
+                "description": article.get("description", ""),
+                "source": article["source"]["name"],
+                "url": article["url"],
+                "published_at": article["publishedAt"],
+                "author": article.get("author")
+            })
+        
+        return {
+            "success": True,
+            "total_results": data.get("totalResults", 0),
+            "articles": articles
+        }
     
     def _get_news_fallback(self, category: str = "general", limit: int = 5) -> Dict[str, Any]:
         """
@@ -3,35 +3,68 @@ Weather Tool - Get current weather information for cities
 """
 
 import os
-import requests
-from typing import Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Tuple
+from urllib.parse import quote
 from tools import BaseTool
+from tools._http import timeout_from_env
+from utils import AsyncSingleFlight, SingleFlight, TTLCache
+
+
+# Successful lookups keyed by (city, units); expired entries are kept for an
+# extra hour so a failed refresh can still answer with the last reading
+_WEATHER_CACHE = TTLCache(ttl=600, maxsize=256, stale_ttl=3600)
+_WEATHER_FLIGHTS = SingleFlight()
+_WEATHER_AFLIGHTS = AsyncSingleFlight()
+
+# Unit labels returned next to the raw numeric readings, per source and unit system
+_OPENWEATHER_UNITS = {
+    "metric": {"temperature": "°C", "wind_speed": "m/s", "pressure": "hPa", "humidity": "%", "clouds": "%"},
+    "imperial": {"temperature": "°F", "wind_speed": "mph", "pressure": "hPa", "humidity": "%", "clouds": "%"}
+}
+_WTTR_UNITS = {
+    "metric": {**_OPENWEATHER_UNITS["metric"], "wind_speed": "km/h", "visibility": "km"},
+    "imperial": {**_OPENWEATHER_UNITS["imperial"], "visibility": "km"}
+}
+
+WTTR_URL = "https://wttr.in/"
+WTTR_PARAMS = {"format": "j1"}
+
+# Concurrent lookups in execute_many; stays below the shared session's pool size
+MAX_PARALLEL_CITIES = 8
 
 
 class WeatherTool(BaseTool):
     """Tool for getting weather information"""
     
+    # Static tool metadata, built once at import and shared by every instance
+    _NAME = "weather"
+    _DESCRIPTION = "Get current weather information for any city including temperature, conditions, humidity, and wind speed"
+    _PARAMETERS = {
+        "city": {
+            "type": "string",
+            "description": "City name (e.g., 'London', 'New York', 'Tokyo')"
+        },
+        "units": {
+            "type": "string",
+            "description": "Temperature units: 'metric' (Celsius) or 'imperial' (Fahrenheit)",
+            "default": "metric",
+            "enum": ["metric", "imperial"]
+        }
+    }
+    
     def __init__(self):
         """Initialize Weather tool"""
         super().__init__(
-            name="weather",
-            description="Get current weather information for any city including temperature, conditions, humidity, and wind speed",
-            parameters={
-                "city": {
-                    "type": "string",
-                    "description": "City name (e.g., 'London', 'New York', 'Tokyo')"
-                },
-                "units": {
-                    "type": "string",
-                    "description": "Temperature units: 'metric' (Celsius) or 'imperial' (Fahrenheit)",
-                    "default": "metric",
-                    "enum": ["metric", "imperial"]
-                }
-            }
+            name=self._NAME,
+            description=self._DESCRIPTION,
+            parameters=self._PARAMETERS
         )
         
         self.api_key = os.getenv("OPENWEATHER_API_KEY")
         self.base_url = "https://api.openweathermap.org/data/2.5/weather"
+        self._params_base = {"appid": self.api_key}
+        self.timeout = timeout_from_env("WEATHER_TOOL_TIMEOUT")
     
     def execute(self, city: str, units: str = "metric", **kwargs) -> Dict[str, Any]:
         """
@@ -44,44 +77,132 @@ class WeatherTool(BaseTool):
         Returns:
             Weather information
         """
-        if not self.api_key:
-            # Fallback: Use free weather API (wttr.in) if OpenWeather API key not available
-            return self._get_weather_fallback(city, units)
+        cache_key = (city.strip().lower(), units)
+        cached = _WEATHER_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
         
-        params = {
-            "q": city,
-            "appid": self.api_key,
-            "units": units
-        }
+        # Concurrent misses for the same city share one upstream request
+        result = _WEATHER_FLIGHTS.do(cache_key, lambda: self._fetch_weather(city, units))
+        return self._cache_result(cache_key, result)
+    
+    async def ainvoke(self, client: Any, city: str, units: str = "metric", **kwargs) -> Dict[str, Any]:
+        """
+        Get current weather for a city using the shared async client
+        
+        Args:
+            client: Shared httpx.AsyncClient, or None to fall back to a thread
+            city: City name
+            units: Temperature units (metric/imperial)
+            
+        Returns:
+            Weather information
+        """
+        if client is None:
+            return await super().ainvoke(client, city=city, units=units, **kwargs)
+        
+        cache_key = (city.strip().lower(), units)
+        cached = _WEATHER_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        result = await _WEATHER_AFLIGHTS.do(
+            cache_key,
+            lambda: self._afetch_weather(client, city, units)
+        )
+        return self._cache_result(cache_key, result)
+    
+    def execute_many(self, cities: List[str], units: str = "metric") -> Dict[str, Any]:
+        """
+        Get current weather for several cities in parallel
+        
+        Each city goes through execute(), so caching and fallbacks apply per
+        city, while the requests overlap on the shared session's pool.
         
-        try:
-            response = requests.get(self.base_url, params=params, timeout=10)
-            response.raise_for_status()
-            data = response.json()
+        Args:
+            cities: City names
+            units: Temperature units (metric/imperial)
             
-            temp_unit = "°C" if units == "metric" else "°F"
-            speed_unit = "m/s" if units == "metric" else "mph"
+        Returns:
+            Weather information per city, in the order given
+        """
+        if not cities:
+            return {"success": False, "error": "No cities given", "results": []}
+        
+        workers = min(MAX_PARALLEL_CITIES, len(cities))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="weather") as pool:
+            results = list(pool.map(lambda city: self.execute(city, units), cities))
+        
+        return {
+            "success": any(result.get("success") for result in results),
+            "results": results
+        }
+    
+    def _cache_result(self, cache_key: Tuple[str, str], result: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Cache a successful lookup, or substitute the last good one on failure
+        
+        Args:
+            cache_key: Normalized (city, units) key
+            result: Freshly fetched weather information
             
-            return {
-                "success": True,
-                "city": data["name"],
-                "country": data["sys"]["country"],
-                "weather": {
-                    "condition": data["weather"][0]["main"],
-                    "description": data["weather"][0]["description"],
-                    "temperature": f"{data['main']['temp']}{temp_unit}",
-                    "feels_like": f"{data['main']['feels_like']}{temp_unit}",
-                    "temp_min": f"{data['main']['temp_min']}{temp_unit}",
-                    "temp_max": f"{data['main']['temp_max']}{temp_unit}",
-                    "humidity": f"{data['main']['humidity']}%",
-                    "pressure": f"{data['main']['pressure']} hPa",
-                    "wind_speed": f"{data['wind']['speed']} {speed_unit}",
-                    "clouds": f"{data['clouds']['all']}%"
-                }
-            }
+        Returns:
+            Weather information to return to the caller
+        """
+        if result.get("success"):
+            _WEATHER_CACHE.set(cache_key, result)
+            return result
+        
+        stale = _WEATHER_CACHE.get_stale(cache_key)
+        if stale is not None:
+            return {**stale, "stale": True}
+        
+        return result
+    
+    def _fetch_weather(self, city: str, units: str = "metric") -> Dict[str, Any]:
+        """
+        Fetch current weather from OpenWeather, falling back to wttr.in
+        
+        Args:
+            city: City name
+            units: Temperature units (metric/imperial)
             
-        except requests.exceptions.RequestException as e:
+        Returns:
+            Weather information
+        """
+        if not self.api_key:
+            # Fallback: Use free weather API (wttr.in) if OpenWeather API key not available
             return self._get_weather_fallback(city, units)
+        
+        return self._http_json(
+            self.base_url,
+            params={**self._params_base, "q": city, "units": units},
+            transform=lambda data: self._format_openweather(data, units),
+            fallback=lambda error: self._get_weather_fallback(city, units)
+        )
+    
+    async def _afetch_weather(self, client: Any, city: str, units: str = "metric") -> Dict[str, Any]:
+        """
+        Async counterpart of _fetch_weather
+        
+        Args:
+            client: Shared httpx.AsyncClient
+            city: City name
+            units: Temperature units (metric/imperial)
+            
+        Returns:
+            Weather information
+        """
+        if not self.api_key:
+            return await self._aget_weather_fallback(client, city, units)
+        
+        return await self._ahttp_json(
+            client,
+            self.base_url,
+            params={**self._params_base, "q": city, "units": units},
+            transform=lambda data: self._format_openweather(data, units),
+            fallback=lambda error: self._aget_weather_fallback(client, city, units)
+        )
     
     def _get_weather_fallback(self, city: str, units: str = "metric") -> Dict[str, Any]:
         """
@@ -94,49 +215,121 @@ class WeatherTool(BaseTool):
         Returns:
             Weather information
         """
-        try:
-            # wttr.in provides free weather data
-            url = f"https://wttr.in/{city}?format=j1"
-            response = requests.get(url, timeout=10)
-            response.raise_for_status()
-            data = response.json()
+        # wttr.in provides free weather data; the city is a path segment
+        return self._http_json(
+            WTTR_URL + quote(city, safe=""),
+            params=WTTR_PARAMS,
+            transform=lambda data: self._format_wttr(data, city, units),
+            fallback=self._unavailable
+        )
+    
+    async def _aget_weather_fallback(self, client: Any, city: str, units: str = "metric") -> Dict[str, Any]:
+        """
+        Async counterpart of _get_weather_fallback
+        
+        Args:
+            client: Shared httpx.AsyncClient
+            city: City name
+            units: Temperature units
             
-            current = data["current_condition"][0]
+        Returns:
+            Weather information
+        """
+        return await self._ahttp_json(
+            client,
+            WTTR_URL + quote(city, safe=""),
+            params=WTTR_PARAMS,
+            transform=lambda data: self._format_wttr(data, city, units),
+            fallback=self._unavailable
+        )
+    
+    def _format_openweather(self, data: Dict[str, Any], units: str) -> Dict[str, Any]:
+        """
+        Build the tool result from an OpenWeather response
+        
+        Args:
+            data: Parsed OpenWeather response
+            units: Temperature units
             
-            # Convert to requested units
-            temp_c = float(current["temp_C"])
-            if units == "imperial":
-                temp = (temp_c * 9/5) + 32
-                temp_unit = "°F"
-                speed_unit = "mph"
-                wind_speed = float(current["windspeedMiles"])
-            else:
-                temp = temp_c
-                temp_unit = "°C"
-                speed_unit = "km/h"
-                wind_speed = float(current["windspeedKmph"])
+        Returns:
+            Weather information
+        """
+        main = data["main"]
+        condition = data["weather"][0]
+        
+        return {
+            "success": True,
+            "city": data["name"],
+            "country": data["sys"]["country"],
+            "weather": {
+                "condition": condition["main"],
+                "description": condition["description"],
+                "temperature": main["temp"],
+                "feels_like": main["feels_like"],
+                "temp_min": main["temp_min"],
+                "temp_max": main["temp_max"],
+                "humidity": main["humidity"],
+                "pressure": main["pressure"],
+                "wind_speed": data["wind"]["speed"],
+                "clouds": data["clouds"]["all"]
+            },
+            "units": _OPENWEATHER_UNITS.get(units, _OPENWEATHER_UNITS["metric"])
+        }
+    
+    def _format_wttr(self, data: Dict[str, Any], city: str, units: str) -> Dict[str, Any]:
+        """
+        Build the tool result from a wttr.in response
+        
+        Args:
+            data: Parsed wttr.in response
+            city: City name as requested
+            units: Temperature units
             
-            return {
-                "success": True,
-                "city": city,
-                "country": data["nearest_area"][0]["country"][0]["value"],
-                "weather": {
-                    "condition": current["weatherDesc"][0]["value"],
-                    "description": current["weatherDesc"][0]["value"],
-                    "temperature": f"{temp:.1f}{temp_unit}",
-                    "feels_like": f"{temp:.1f}{temp_unit}",
-                    "humidity": f"{current['humidity']}%",
-                    "pressure": f"{current['pressure']} hPa",
-                    "wind_speed": f"{wind_speed} {speed_unit}",
-                    "clouds": f"{current['cloudcover']}%",
-                    "visibility": f"{current['visibility']} km"
-                },
-                "source": "wttr.in (fallback)"
-            }
+        Returns:
+            Weather information
+        """
+        current = data["current_condition"][0]
+        description = current["weatherDesc"][0]["value"]
+        
+        # wttr.in reports both unit systems; pick the requested one
+        if units == "imperial":
+            temp = round(float(current["temp_C"]) * 9 / 5 + 32, 1)
+            wind_speed = float(current["windspeedMiles"])
+        else:
+            temp = float(current["temp_C"])
+            wind_speed = float(current["windspeedKmph"])
+        
+        return {
+            "success": True,
+            "city": city,
+            "country": data["nearest_area"][0]["country"][0]["value"],
+            "weather": {
+                "condition": description,
+                "description": description,
+                "temperature": temp,
+                "feels_like": temp,
+                "humidity": int(current["humidity"]),
+                "pressure": int(current["pressure"]),
+                "wind_speed": wind_speed,
+                "clouds": int(current["cloudcover"]),
+                "visibility": float(current["visibility"])
+            },
+            "units": _WTTR_UNITS.get(units, _WTTR_UNITS["metric"]),
+            "source": "wttr.in (fallback)"
+        }
+    
+    def _unavailable(self, error: Exception) -> Dict[str, Any]:
+        """
+        Build the result returned when no weather source answered
+        
+        Args:
+            error: Exception raised by the last source tried
             
-        except Exception as e:
-            return {
-                "success": False,
-                "error": f"Unable to fetch weather data: {str(e)}",
-                "message": "Weather API is unavailable. Please add OPENWEATHER_API_KEY to .env or check your internet connection."
-            }
+        Returns:
+            Failure result
+        """
+        return {
+            "success": False,
+            "error": f"Unable to fetch weather data: {str(error)}",
+            "message": "Weather API is unavailable. Please add OPENWEATHER_API_KEY to .env or check your internet connection."
+        }
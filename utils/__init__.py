@@ -0,0 +1,8 @@
+"""
+Utilities package for AI Operations Assistant
+"""
+
+from .cache import AsyncSingleFlight, SingleFlight, TTLCache
+from .serialization import ORJSON_AVAILABLE, dumps, loads
+
+__all__ = ['AsyncSingleFlight', 'ORJSON_AVAILABLE', 'SingleFlight', 'TTLCache', 'dumps', 'loads']
@@ -0,0 +1,188 @@
+"""
+In-process caching helpers - TTL expiry with LRU eviction, in-flight deduplication
+"""
+
+import asyncio
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+class TTLCache:
+    """Thread-safe mapping whose entries expire after a fixed TTL"""
+    
+    def __init__(self, ttl: float, maxsize: int = 256, stale_ttl: float = 0):
+        """
+        Initialize cache
+        
+        Args:
+            ttl: Seconds an entry stays valid
+            maxsize: Maximum number of entries before LRU eviction
+            stale_ttl: Extra seconds an expired entry is kept for get_stale()
+        """
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.stale_ttl = stale_ttl
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Look up a live entry
+        
+        Args:
+            key: Cache key
+            default: Value returned on a miss or expired entry
+            
+        Returns:
+            Cached value or default
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            
+            expires_at, value = entry
+            now = time.monotonic()
+            if expires_at <= now:
+                if expires_at + self.stale_ttl <= now:
+                    del self._data[key]
+                return default
+            
+            self._data.move_to_end(key)
+            return value
+    
+    def get_stale(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Look up an entry that may have expired but is within its stale window
+        
+        Meant for serving the last known value when a refresh fails.
+        
+        Args:
+            key: Cache key
+            default: Value returned if the entry is missing or too old
+            
+        Returns:
+            Cached value or default
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            
+            expires_at, value = entry
+            if expires_at + self.stale_ttl <= time.monotonic():
+                del self._data[key]
+                return default
+            
+            return value
+    
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Store an entry, evicting the least recently used one when full
+        
+        Args:
+            key: Cache key
+            value: Value to cache
+        """
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+    
+    def clear(self) -> None:
+        """Drop all entries"""
+        with self._lock:
+            self._data.clear()
+    
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class SingleFlight:
+    """Collapses concurrent calls for the same key into one execution"""
+    
+    def __init__(self):
+        """Initialize with no calls in flight"""
+        self._inflight: Dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+    
+    def do(self, key: Hashable, func: Callable[[], Any]) -> Any:
+        """
+        Run func, or wait for the call already running under the same key
+        
+        Args:
+            key: Deduplication key
+            func: Zero-argument callable producing the value
+            
+        Returns:
+            Value returned by whichever caller ran func; its exception is
+            re-raised in every waiter
+        """
+        with self._lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = self._inflight[key] = Future()
+        
+        if not leader:
+            return future.result()
+        
+        try:
+            result = func()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+
+class AsyncSingleFlight:
+    """Collapses concurrent coroutine calls for the same key into one task"""
+    
+    def __init__(self):
+        """Initialize with no calls in flight"""
+        # Tasks belong to the loop that created them, so each loop gets its own map
+        self._inflight: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Hashable, asyncio.Task]]" = weakref.WeakKeyDictionary()
+    
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Await func, or join the task already running under the same key
+        
+        The shared task is shielded, so a cancelled waiter does not cancel
+        it for the others.
+        
+        Args:
+            key: Deduplication key
+            func: Zero-argument coroutine function producing the value
+            
+        Returns:
+            Value produced by the shared task; its exception is re-raised
+            in every waiter
+        """
+        loop = asyncio.get_running_loop()
+        inflight = self._inflight.get(loop)
+        if inflight is None:
+            inflight = self._inflight[loop] = {}
+        
+        task = inflight.get(key)
+        if task is None:
+            task = inflight[key] = loop.create_task(func())
+            
+            def done(finished: asyncio.Task) -> None:
+                if inflight.get(key) is finished:
+                    del inflight[key]
+                if not finished.cancelled():
+                    finished.exception()  # Mark retrieved even if every waiter left
+            
+            task.add_done_callback(done)
+        
+        return await asyncio.shield(task)